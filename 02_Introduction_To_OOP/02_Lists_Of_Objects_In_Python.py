@@ -14,11 +14,45 @@
 # So in short:
 # “A list of objects in Python is simply a collection of class instances stored inside a list, which allows us to manage multiple entities in a structured way using OOP principles.”
 
+# Persistence
+# Accounts are kept in a DurableBankStore (write-ahead log + snapshots) from the
+# BankAccount mini-project, so they survive exits and crashes. Every change made
+# from the menu is also recorded in the store, and on startup the list of objects
+# is rebuilt from it.
+
+# Headless mode
+# BankService is the same bank without input()/print(), so accounts can be bulk
+# imported from CSV/JSONL and transaction scripts replayed at scale:
+#   python 02_Lists_Of_Objects_In_Python.py                      -> interactive menu
+#   python 02_Lists_Of_Objects_In_Python.py import accounts.csv  -> bulk import
+#   python 02_Lists_Of_Objects_In_Python.py replay script.jsonl  -> replay + report
+
+import argparse
+import csv
+import importlib
+import json
+import os
+import sys
+import time
 from random import randint
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", "12_Mini_Projects_O0P", "01_Core_OOP_Concepts"))
+bank_project = importlib.import_module("01_BankAccount_Project")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bank_data")
+
+
 class Bank:
-    def __init__(self):
-        self.account = randint(100000, 999999)
+    def __init__(self, account=None, full_name=None, phone_number=None, balance=0):
+        # Without a name the details are asked interactively (new account);
+        # with a name an existing account is restored without prompting.
+        self.account = account if account is not None else randint(100000, 999999)
+        if full_name is not None:
+            self.full_name = full_name
+            self.phone_number = phone_number
+            self.balance = balance
+            return
         self.full_name = input("Enter your full name: ")
         self.phone_number = input("Enter your phone number: ")
         self.balance = 0
@@ -44,8 +78,10 @@ class Bank:
             else:
                 self.balance -= amount
                 print(f"\u2705 Withdrawal successful. Remaining Balance: {self.balance} PKR")
+                return amount
         except ValueError:
             print("\u274C Invalid amount.")
+        return 0
 
     def deposit(self):
         try:
@@ -55,91 +91,280 @@ class Bank:
             else:
                 self.balance += amount
                 print(f"\u2705 Deposit successful. Current Balance: {self.balance} PKR")
+                return amount
         except ValueError:
             print("\u274C Invalid amount.")
+        return 0
+
 
+# Account registry
+# The accounts are still a collection of Bank objects, but they are indexed by
+# account number in a dict, so finding an account is O(1) instead of a scan of
+# the whole list. Iterating the registry keeps creation order.
+class AccountRegistry:
+    def __init__(self):
+        self._by_number = {}
 
-# List to store all Bank accounts
-banks = []
+    def new_account_number(self):
+        # randint() can repeat a number, so draw again until it is unused
+        if len(self._by_number) >= 900000:
+            raise ValueError("All 6-digit account numbers are in use.")
+        while True:
+            acc_no = randint(100000, 999999)
+            if acc_no not in self._by_number:
+                return acc_no
 
-def find_account(acc_no):
-    for obj in banks:
-        if obj.account == acc_no:
-            return obj
-    return None
+    def add(self, account):
+        if account.account in self._by_number:
+            raise ValueError(f"Account number {account.account} already exists.")
+        self._by_number[account.account] = account
 
+    def remove(self, acc_no):
+        return self._by_number.pop(acc_no, None)
 
-# Main menu
-while True:
-    print("\n========== Bank Menu ==========")
-    print("1. Create New Account")
-    print("2. Show All Accounts")
-    print("3. Deposit Amount")
-    print("4. Withdraw Amount")
-    print("5. Transfer Amount")
-    print("6. Exit")
-    print("================================")
+    def find(self, acc_no):
+        return self._by_number.get(acc_no)
 
-    try:
-        choice = int(input("Enter your choice: "))
-    except ValueError:
-        print("\u274C Invalid input. Please enter a number.")
-        continue
-
-    if choice == 1:
-        new_account = Bank()
-        banks.append(new_account)
-
-    elif choice == 2:
-        if not banks:
-            print("\u274C No accounts available.")
+    def __iter__(self):
+        return iter(self._by_number.values())
+
+    def __len__(self):
+        return len(self._by_number)
+
+# Headless bank service
+# Every operation validates, updates the Bank object and records the change in
+# the durable store. Nothing is printed and nothing is read from input().
+class BankService:
+    def __init__(self, data_dir=DATA_DIR, group_size=64):
+        # Durable store, recovered from the latest snapshot + log tail
+        self.store = bank_project.DurableBankStore(data_dir, group_size=group_size)
+        # Registry of all Bank accounts (rebuilt from the store)
+        self.banks = AccountRegistry()
+        for acc_no, acc in self.store.accounts.items():
+            self.banks.add(Bank(acc_no, acc.account_holder, acc.contact, acc.balance))
+
+    def open_account(self, full_name, phone_number, balance=0, acc_no=None):
+        if acc_no is None:
+            acc_no = self.banks.new_account_number()
+        if not self.store.open_account(acc_no, full_name, phone_number, balance):
+            return None
+        account = Bank(acc_no, full_name, phone_number, balance)
+        self.banks.add(account)
+        return account
+
+    def deposit(self, acc_no, amount):
+        if not self.store.deposit(acc_no, amount):
+            return False
+        self.banks.find(acc_no).balance += amount
+        return True
+
+    def withdraw(self, acc_no, amount):
+        if not self.store.withdraw(acc_no, amount):
+            return False
+        self.banks.find(acc_no).balance -= amount
+        return True
+
+    def transfer(self, from_acc, to_acc, amount):
+        if not self.store.transfer(from_acc, to_acc, amount):
+            return False
+        self.banks.find(from_acc).balance -= amount
+        self.banks.find(to_acc).balance += amount
+        return True
+
+    def close(self):
+        self.store.snapshot()  # keeps the next startup fast
+        self.store.close()
+
+
+# Streaming readers: rows are yielded one at a time, so files of any size can be
+# processed without loading them into memory.
+def read_records(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
         else:
-            for acc in banks:
-                acc.show_info()
+            yield from csv.DictReader(f)
+
+
+def parse_int(value):
+    # Whole numbers only, the same for CSV text and JSON values: 12.75 or true
+    # is a failed record, never truncated to 12 or read as 1
+    if isinstance(value, bool):
+        raise ValueError(f"not an integer: {value!r}")
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (int, str)):
+        return int(value)
+    raise ValueError(f"not an integer: {value!r}")
 
-    elif choice == 3:
-        acc_no = int(input("Enter your account number: "))
-        account = find_account(acc_no)
+
+def throughput_report(label, ok, failed, seconds):
+    total = ok + failed
+    rate = total / seconds if seconds else float("inf")
+    return {"job": label, "records": total, "ok": ok, "failed": failed,
+            "seconds": round(seconds, 3), "records_per_sec": round(rate)}
+
+
+# Bulk account import
+# Columns / keys: full_name, phone_number, balance (optional), account (optional)
+def import_accounts(service, path):
+    ok = failed = 0
+    start = time.perf_counter()
+    for row in read_records(path):
+        try:
+            acc_no, balance = row.get("account"), row.get("balance")
+            account = service.open_account(
+                row["full_name"], row.get("phone_number") or "",
+                parse_int(balance) if balance not in (None, "") else 0,
+                parse_int(acc_no) if acc_no not in (None, "") else None)
+        except (KeyError, ValueError):
+            account = None
         if account:
-            account.deposit()
+            ok += 1
         else:
-            print("\u274C Account not found.")
+            failed += 1
+    service.store.commit()
+    return throughput_report("import", ok, failed, time.perf_counter() - start)
+
+
+# Transaction script replay
+# Columns / keys: op (deposit | withdraw | transfer), account, amount, to_account
+def replay_transactions(service, path):
+    ok = failed = 0
+    start = time.perf_counter()
+    for row in read_records(path):
+        try:
+            op, acc_no, amount = row["op"], parse_int(row["account"]), parse_int(row["amount"])
+            if op == "deposit":
+                done = service.deposit(acc_no, amount)
+            elif op == "withdraw":
+                done = service.withdraw(acc_no, amount)
+            elif op == "transfer":
+                done = service.transfer(acc_no, parse_int(row["to_account"]), amount)
+            else:
+                done = False
+        except (KeyError, ValueError):
+            done = False
+        if done:
+            ok += 1
+        else:
+            failed += 1
+    service.store.commit()
+    return throughput_report("replay", ok, failed, time.perf_counter() - start)
+
+
+# Main menu
+def run_menu(data_dir=DATA_DIR):
+    service = BankService(data_dir, group_size=1)  # interactive: commit every action
+    store, banks = service.store, service.banks
+    find_account = banks.find
+
+    while True:
+        print("\n========== Bank Menu ==========")
+        print("1. Create New Account")
+        print("2. Show All Accounts")
+        print("3. Deposit Amount")
+        print("4. Withdraw Amount")
+        print("5. Transfer Amount")
+        print("6. Exit")
+        print("================================")
+
+        try:
+            choice = int(input("Enter your choice: "))
+        except ValueError:
+            print("\u274C Invalid input. Please enter a number.")
+            continue
+
+        if choice == 1:
+            new_account = Bank(banks.new_account_number())
+            banks.add(new_account)
+            store.open_account(new_account.account, new_account.full_name, new_account.phone_number)
+
+        elif choice == 2:
+            if not banks:
+                print("\u274C No accounts available.")
+            else:
+                for acc in banks:
+                    acc.show_info()
+
+        elif choice == 3:
+            acc_no = int(input("Enter your account number: "))
+            account = find_account(acc_no)
+            if account:
+                amount = account.deposit()
+                if amount:
+                    store.deposit(acc_no, amount)
+            else:
+                print("\u274C Account not found.")
+
+        elif choice == 4:
+            acc_no = int(input("Enter your account number: "))
+            account = find_account(acc_no)
+            if account:
+                amount = account.withdraw()
+                if amount:
+                    store.withdraw(acc_no, amount)
+            else:
+                print("\u274C Account not found.")
+
+        elif choice == 5:
+            from_acc = int(input("Enter sender's account number: "))
+            to_acc = int(input("Enter receiver's account number: "))
+            sender = find_account(from_acc)
+            receiver = find_account(to_acc)
+
+            if sender and receiver:
+                try:
+                    amount = int(input("Enter amount to transfer: "))
+                    if amount <= 0:
+                        print("\u274C Amount must be greater than zero.")
+                    elif sender.balance < amount:
+                        print("\u274C Insufficient balance in sender's account.")
+                    else:
+                        sender.balance -= amount
+                        receiver.balance += amount
+                        store.transfer(from_acc, to_acc, amount)
+                        print("\u2705 Transfer successful.")
+                        print(f"Sender Balance: {sender.balance} PKR")
+                        print(f"Receiver Balance: {receiver.balance} PKR")
+                except ValueError:
+                    print("\u274C Invalid amount.")
+            else:
+                print("\u274C One or both account numbers are invalid.")
+
+        elif choice == 6:
+            store.snapshot()  # keeps the next startup fast
+            store.close()
+            print("\ud83d\udc4b Exiting. Thank you for using our bank system.")
+            break
 
-    elif choice == 4:
-        acc_no = int(input("Enter your account number: "))
-        account = find_account(acc_no)
-        if account:
-            account.withdraw()
         else:
-            print("\u274C Account not found.")
-
-    elif choice == 5:
-        from_acc = int(input("Enter sender's account number: "))
-        to_acc = int(input("Enter receiver's account number: "))
-        sender = find_account(from_acc)
-        receiver = find_account(to_acc)
-
-        if sender and receiver:
-            try:
-                amount = int(input("Enter amount to transfer: "))
-                if amount <= 0:
-                    print("\u274C Amount must be greater than zero.")
-                elif sender.balance < amount:
-                    print("\u274C Insufficient balance in sender's account.")
-                else:
-                    sender.balance -= amount
-                    receiver.balance += amount
-                    print("\u2705 Transfer successful.")
-                    print(f"Sender Balance: {sender.balance} PKR")
-                    print(f"Receiver Balance: {receiver.balance} PKR")
-            except ValueError:
-                print("\u274C Invalid amount.")
+            print("\u274C Invalid choice. Please select from 1 to 6.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bank accounts: interactive menu or headless bulk jobs.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="directory of the durable store")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("import", help="bulk import accounts").add_argument("path", help="CSV or .jsonl file")
+    sub.add_parser("replay", help="replay a transaction script").add_argument("path", help="CSV or .jsonl file")
+    args = parser.parse_args()
+
+    if args.command is None:
+        run_menu(args.data_dir)
+        return
+    service = BankService(args.data_dir)
+    try:
+        if args.command == "import":
+            report = import_accounts(service, args.path)
         else:
-            print("\u274C One or both account numbers are invalid.")
+            report = replay_transactions(service, args.path)
+    finally:
+        service.close()
+    print(json.dumps(report))
 
-    elif choice == 6:
-        print("\ud83d\udc4b Exiting. Thank you for using our bank system.")
-        break
 
-    else:
-        print("\u274C Invalid choice. Please select from 1 to 6.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Benchmark Suite for the Banking Mini Projects
+Category: Core OOP Concepts (companion to 01_BankAccount_Project.py)
+
+Problem Statement:
+------------------
+Measure the banking code under load so performance regressions are caught
+before they are merged.
+
+Targets (what is being measured):
+- account : plain BankAccount objects (deposit / withdraw print, stdout is discarded)
+- ledger  : LedgerBankAccount, journal-backed accounts
+- registry: ConcurrentBankRegistry (lock-striped), single thread
+- service : BankService from the Bank menu (02_Lists_Of_Objects_In_Python.py),
+            i.e. the menu logic plus its durable store, in a temporary directory
+
+Workloads (seeded, synthetic):
+- deposit_heavy : 80% deposits, 10% withdrawals, 10% transfers
+- withdraw_heavy: 10% deposits, 80% withdrawals, 10% transfers
+- transfer_heavy: 10% deposits, 10% withdrawals, 80% transfers
+- hot_skew      : even mix, but 90% of operations hit 1% of the accounts
+
+For every (target, workload) pair the report contains ops/sec, p50 / p99
+latency in microseconds and peak traced memory. Each pair gets an untimed
+warm-up pass and then --repeat timed passes; the report keeps the best
+pass for each metric (highest ops/sec, lowest latency), which is the
+least disturbed by other load on the machine, plus its spread
+((max - min) / median) across the passes.
+Results are written as JSON and can be compared with an earlier run; a
+change only counts as a regression when it exceeds the threshold plus the
+measured spread, so run-to-run noise is not flagged:
+
+    python 01_BankAccount_Benchmarks.py --ops 100000 --repeat 5 --output new.json
+    python 01_BankAccount_Benchmarks.py --compare old.json --threshold 0.10
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(HERE)
+sys.path.append(os.path.join(HERE, "..", "..", "02_Introduction_To_OOP"))
+bank_project = importlib.import_module("01_BankAccount_Project")
+bank_menu = importlib.import_module("02_Lists_Of_Objects_In_Python")
+
+
+# ------------------ Workloads ------------------ #
+
+WORKLOADS = {
+    # name: (deposit share, withdraw share, hot-account share of traffic)
+    "deposit_heavy": (0.8, 0.1, None),
+    "withdraw_heavy": (0.1, 0.8, None),
+    "transfer_heavy": (0.1, 0.1, None),
+    "hot_skew": (0.34, 0.33, 0.9),
+}
+
+
+def generate_ops(workload, num_ops, num_accounts, seed):
+    """Build a reproducible list of (op, account, amount, to_account) tuples."""
+    deposit_share, withdraw_share, hot_share = WORKLOADS[workload]
+    rng = random.Random(seed)
+    hot_count = max(1, num_accounts // 100)
+
+    def pick():
+        if hot_share is not None and rng.random() < hot_share:
+            return rng.randrange(hot_count)
+        return rng.randrange(num_accounts)
+
+    ops = []
+    for _ in range(num_ops):
+        r = rng.random()
+        op = "deposit" if r < deposit_share else "withdraw" if r < deposit_share + withdraw_share else "transfer"
+        ops.append((op, pick(), rng.randint(1, 500), pick()))
+    return ops
+
+
+# ------------------ Targets ------------------ #
+# Each target builds its accounts and returns a function run(op, acc, amount, to_acc).
+
+class AccountTarget:
+    """Plain BankAccount objects; a transfer is a withdraw followed by a deposit."""
+
+    def setup(self, num_accounts, data_dir):
+        self.accounts = [bank_project.BankAccount(f"Holder-{i}", 1000) for i in range(num_accounts)]
+
+    def run(self, op, acc, amount, to_acc):
+        account = self.accounts[acc]
+        if op == "deposit":
+            account.deposit(amount)
+        elif op == "withdraw":
+            account.withdraw(amount)
+        elif acc != to_acc and amount <= account.balance:
+            account.withdraw(amount)
+            self.accounts[to_acc].deposit(amount)
+
+
+class LedgerTarget(AccountTarget):
+    """Journal-backed LedgerBankAccount objects."""
+
+    def setup(self, num_accounts, data_dir):
+        self.accounts = [bank_project.LedgerBankAccount(f"Holder-{i}", 1000) for i in range(num_accounts)]
+
+    def run(self, op, acc, amount, to_acc):
+        account = self.accounts[acc]
+        if op == "deposit":
+            account.post_batch(((account.DEPOSIT, amount),))
+        elif op == "withdraw":
+            account.post_batch(((account.WITHDRAW, amount),))
+        elif acc != to_acc and account.post_batch(((account.WITHDRAW, amount),))["posted"]:
+            self.accounts[to_acc].post_batch(((account.DEPOSIT, amount),))
+
+
+class RegistryTarget:
+    """Lock-striped ConcurrentBankRegistry."""
+
+    def setup(self, num_accounts, data_dir):
+        self.registry = bank_project.ConcurrentBankRegistry()
+        for i in range(num_accounts):
+            self.registry.open_account(i, f"Holder-{i}", 1000)
+
+    def run(self, op, acc, amount, to_acc):
+        if op == "deposit":
+            self.registry.deposit(acc, amount)
+        elif op == "withdraw":
+            self.registry.withdraw(acc, amount)
+        else:
+            self.registry.transfer(acc, to_acc, amount)
+
+
+class ServiceTarget:
+    """The Bank menu logic (BankService) with its durable store."""
+
+    def setup(self, num_accounts, data_dir):
+        self.service = bank_menu.BankService(data_dir)
+        for i in range(num_accounts):
+            self.service.open_account(f"Holder-{i}", "0300-0000000", 1000, acc_no=i)
+
+    def run(self, op, acc, amount, to_acc):
+        if op == "deposit":
+            self.service.deposit(acc, amount)
+        elif op == "withdraw":
+            self.service.withdraw(acc, amount)
+        else:
+            self.service.transfer(acc, to_acc, amount)
+
+    def teardown(self):
+        self.service.store.close()
+
+
+TARGETS = {
+    "account": AccountTarget,
+    "ledger": LedgerTarget,
+    "registry": RegistryTarget,
+    "service": ServiceTarget,
+}
+
+
+# ------------------ Measurement ------------------ #
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def spread(values):
+    """(max - min) / median: how much repeated passes disagree."""
+    middle = statistics.median(values)
+    return round((max(values) - min(values)) / middle, 3) if middle else 0.0
+
+
+def timed_pass(target_name, ops, num_accounts):
+    """Run `ops` on a fresh target; returns (seconds, sorted latencies in ns)."""
+    latencies = []
+    clock = time.perf_counter_ns
+    with tempfile.TemporaryDirectory() as data_dir:
+        target = TARGETS[target_name]()
+        target.setup(num_accounts, data_dir)
+        run, record = target.run, latencies.append
+        start = time.perf_counter()
+        for op in ops:
+            t0 = clock()
+            run(*op)
+            record(clock() - t0)
+        elapsed = time.perf_counter() - start
+        if hasattr(target, "teardown"):
+            target.teardown()
+    latencies.sort()
+    return elapsed, latencies
+
+
+def peak_memory(target_name, ops, num_accounts):
+    """Peak traced memory in bytes for one pass (tracemalloc is slow, so not timed)."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        tracemalloc.start()
+        target = TARGETS[target_name]()
+        target.setup(num_accounts, data_dir)
+        for op in ops:
+            target.run(*op)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if hasattr(target, "teardown"):
+            target.teardown()
+    return peak
+
+
+def measure(pairs, num_ops, num_accounts, seed, repeat=3):
+    """
+    Benchmark every (target, workload) pair in `pairs`:
+    1. warm-up pass per pair (not recorded): imports, caches and allocator settle
+    2. `repeat` rounds of timed passes; each round runs every pair once, so
+       a slow spell on the machine is spread over all pairs instead of
+       hitting every pass of one of them. The best value of each metric
+       is reported with its spread.
+    3. traced pass per pair: peak memory with tracemalloc
+    Returns one result dict per pair, in order.
+    """
+    ops = {pair: generate_ops(pair[1], num_ops, num_accounts, seed) for pair in pairs}
+    samples = {pair: ([], [], []) for pair in pairs}  # rates, p50s, p99s
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for target_name, workload in pairs:
+            timed_pass(target_name, ops[target_name, workload], num_accounts)
+        for _ in range(repeat):
+            for pair in pairs:
+                elapsed, latencies = timed_pass(pair[0], ops[pair], num_accounts)
+                rates, p50s, p99s = samples[pair]
+                rates.append(num_ops / elapsed)
+                p50s.append(percentile(latencies, 0.50) / 1000)
+                p99s.append(percentile(latencies, 0.99) / 1000)
+        peaks = {pair: peak_memory(pair[0], ops[pair], num_accounts) for pair in pairs}
+
+    results = []
+    for target_name, workload in pairs:
+        rates, p50s, p99s = samples[target_name, workload]
+        results.append({
+            "target": target_name,
+            "workload": workload,
+            "ops": num_ops,
+            "repeat": repeat,
+            "ops_per_sec": round(max(rates)),
+            "p50_us": round(min(p50s), 2),
+            "p99_us": round(min(p99s), 2),
+            "peak_memory_kb": round(peaks[target_name, workload] / 1024, 1),
+            "spread": {"ops_per_sec": spread(rates), "p99_us": spread(p99s)},
+        })
+    return results
+
+
+def git_commit():
+    """Current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    """
+    Compare two runs. A result regresses when ops/sec drops, or p99 latency
+    or peak memory grows, by more than `threshold` (e.g. 0.10 = 10%).
+    For ops/sec and p99 the larger spread measured in either run is added
+    to the threshold, so a metric that is that noisy is not flagged.
+    Reports without spreads (older runs) use the threshold alone.
+    Returns a list of human readable regression lines.
+    """
+    old = {(r["target"], r["workload"]): r for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        before = old.get((r["target"], r["workload"]))
+        if before is None:
+            continue
+
+        def allowed(metric):
+            noise = max(before.get("spread", {}).get(metric, 0), r.get("spread", {}).get(metric, 0))
+            return threshold + noise
+
+        checks = [
+            ("ops_per_sec", before["ops_per_sec"] * (1 - allowed("ops_per_sec")) > r["ops_per_sec"]),
+            ("p99_us", r["p99_us"] > before["p99_us"] * (1 + allowed("p99_us"))),
+            ("peak_memory_kb", r["peak_memory_kb"] > before["peak_memory_kb"] * (1 + threshold)),
+        ]
+        for metric, regressed in checks:
+            if regressed:
+                regressions.append(f"{r['target']}/{r['workload']} {metric}: "
+                                   f"{before[metric]} -> {r[metric]}")
+    return regressions
+
+
+# ------------------ Command Line ------------------ #
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput / latency benchmarks for the banking projects.")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument("--ops", type=int, default=20000, help="operations per workload")
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per workload (best is reported)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="JSON report of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed regression (fraction)")
+    args = parser.parse_args()
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {"ops": args.ops, "accounts": args.accounts, "seed": args.seed, "repeat": args.repeat},
+        "results": [],
+    }
+    pairs = [(target, workload) for target in args.targets for workload in args.workloads]
+    for result in measure(pairs, args.ops, args.accounts, args.seed, args.repeat):
+        report["results"].append(result)
+        target, workload = result["target"], result["workload"]
+        print(f"{target:>9} {workload:<15} {result['ops_per_sec']:>10} ops/s  "
+              f"p50 {result['p50_us']:>8} us  p99 {result['p99_us']:>8} us  "
+              f"peak {result['peak_memory_kb']:>9} KB  "
+              f"spread {result['spread']['ops_per_sec']:.1%}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,8 +17,71 @@ This project demonstrates:
 - Encapsulation
 - Input validation
 - Testing using __main__
+
+Extension: Journal-backed accounts
+----------------------------------
+LedgerBankAccount keeps every deposit and withdrawal in a compact,
+append-only journal (two typed arrays instead of one object per entry)
+and posts them in batches through post_batch(). The balance is a running
+total updated as entries are posted, so it never needs a replay; the
+opening balance is journaled too, so history() adds up to the balance.
+
+Extension: Concurrent accounts
+------------------------------
+ConcurrentBankRegistry lets many worker threads operate on accounts at
+once. Accounts are spread over a small fixed pool of striped locks, so
+withdraw() is an atomic check-then-act and transfer() locks both stripes
+in a fixed order (lowest index first), which rules out deadlock.
+
+Extension: Columnar account store (requires NumPy)
+--------------------------------------------------
+AccountStore keeps holder ids and balances (int64 cents) in parallel
+NumPy arrays. Month-end passes such as apply_interest(), charge_fee()
+and overdraft_report() run as single vectorized expressions instead of
+a Python loop over BankAccount objects. store[i] returns an AccountView
+that behaves like a BankAccount but reads and writes the arrays.
+
+Extension: Durable storage
+--------------------------
+DurableBankStore survives restarts and crashes. Operations are appended
+to a write-ahead log that is fsync'd in groups (group commit), compact
+binary snapshots are taken periodically, and recovery loads the latest
+snapshot and replays only the log tail written after it.
+
+Extension: Async service
+------------------------
+AsyncAccountService serves deposit / withdraw / balance requests from many
+concurrent clients over a local TCP socket. Requests for the same account
+are coalesced into a single state update per event-loop tick.
+
+Extension: Multi-process sharding
+---------------------------------
+ShardedBankEngine partitions accounts by account number over N worker
+processes (one core each, no shared GIL). A coordinator routes batches of
+operations to the owning workers over multiprocessing pipes and runs
+cross-shard transfers with a two-phase commit.
 """
 
+import asyncio
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # only AccountStore needs NumPy
+    np = None
+
+# Shared Money helpers (exact integer cents), used for all money arithmetic
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from Money_Module import SCALE, Money, from_minor, to_minor
+
 # -------------------- CLASS DEFINITION --------------------
 
 class BankAccount:
@@ -29,10 +92,20 @@ class BankAccount:
         Initialize account with:
         - account_holder: The name of the account owner
         - balance: Starting balance (default is 0)
+        The balance is kept as integer cents in self.minor.
         """
         self.account_holder = account_holder
         self.balance = balance
 
+    @property
+    def balance(self):
+        """Current balance as a plain number (an int when whole)."""
+        return from_minor(self.minor)
+
+    @balance.setter
+    def balance(self, value):
+        self.minor = to_minor(value)
+
     def deposit(self, amount):
         """
         Deposit money into account.
@@ -42,7 +115,7 @@ class BankAccount:
         if amount <= 0:
             print(" Deposit amount must be positive.")
             return self.balance
-        self.balance += amount
+        self._adjust(amount)
         print(f" Deposited {amount}. New Balance = {self.balance}")
         return self.balance
 
@@ -55,13 +128,18 @@ class BankAccount:
         if amount <= 0:
             print(" Withdrawal amount must be positive.")
             return self.balance
-        if amount > self.balance:
+        minor = to_minor(amount)
+        if minor > self.minor:
             print(" Insufficient balance.")
             return self.balance
-        self.balance -= amount
+        self.minor -= minor
         print(f" Withdrew {amount}. New Balance = {self.balance}")
         return self.balance
 
+    def _adjust(self, amount):
+        """Add `amount` (may be negative) to the integer cents; only `amount` is converted."""
+        self.minor += to_minor(amount)
+
     def check_balance(self):
         """Display the current balance."""
         print(f" Account Holder: {self.account_holder}, Current Balance = {self.balance}")
@@ -72,6 +150,948 @@ class BankAccount:
         return f"Account Holder: {self.account_holder}, Balance: {self.balance}"
 
 
+# -------------------- JOURNAL-BACKED ACCOUNT --------------------
+
+class LedgerBankAccount(BankAccount):
+    """
+    A bank account backed by an append-only transaction journal.
+
+    - Entries are stored as (kind, amount) in two parallel arrays:
+      kind is OPENING, DEPOSIT or WITHDRAW, amount is the posted value
+      in integer cents (exact, no float rounding).
+    - Setting the balance (the constructor does) journals the change as
+      an OPENING entry, so the journal always sums to the balance.
+    - post_batch() validates and applies many entries in one call,
+      with no printing per entry.
+    - self.balance is a running total, so reading it is O(1); like
+      BankAccount it is a plain number, and self.minor holds the
+      exact cents.
+    """
+
+    DEPOSIT = 1
+    WITHDRAW = 2
+    OPENING = 3
+
+    def __init__(self, account_holder, balance=0):
+        self._kinds = array("b")    # OPENING / DEPOSIT / WITHDRAW per entry
+        self._amounts = array("q")  # posted amount per entry, in cents (OPENING: signed change)
+        self.minor = 0
+        super().__init__(account_holder, balance)
+
+    @property
+    def balance(self):
+        return from_minor(self.minor)
+
+    @balance.setter
+    def balance(self, value):
+        minor = to_minor(value)
+        self._kinds.append(self.OPENING)
+        self._amounts.append(minor - self.minor)
+        self.minor = minor
+
+    def post_batch(self, transactions):
+        """
+        Validate and apply a batch of transactions.
+        - transactions: iterable of (kind, amount) pairs, where kind is
+          DEPOSIT / WITHDRAW or the strings "deposit" / "withdraw", and
+          amount is a number or Money (converted to cents on entry).
+        - Entries are applied in order; a withdrawal is rejected if it
+          would overdraw the balance at that point in the batch.
+        - An amount that is not a finite number (None, nan, "abc") is
+          rejected like any other invalid entry.
+        - Only accepted entries are appended to the journal, all together
+          after the loop, so the journal and balance always agree.
+        Returns a summary dict: posted, rejected, balance.
+        """
+        deposit, withdraw = self.DEPOSIT, self.WITHDRAW
+        kinds_by_name = {"deposit": deposit, "withdraw": withdraw,
+                         deposit: deposit, withdraw: withdraw}
+        kinds, amounts = array("b"), array("q")
+        append_kind = kinds.append
+        append_amount = amounts.append
+        balance = self.minor
+        posted = rejected = 0
+
+        for kind, amount in transactions:
+            kind = kinds_by_name.get(kind)
+            try:
+                amount = amount * SCALE if type(amount) is int else to_minor(amount)
+            except (TypeError, ValueError, ArithmeticError):
+                rejected += 1
+                continue
+            if kind is None or amount <= 0:
+                rejected += 1
+                continue
+            if kind == deposit:
+                balance += amount
+            elif amount > balance:
+                rejected += 1
+                continue
+            else:
+                balance -= amount
+            append_kind(kind)
+            append_amount(amount)
+            posted += 1
+
+        self._kinds.extend(kinds)
+        self._amounts.extend(amounts)
+        self.minor = balance
+        return {"posted": posted, "rejected": rejected, "balance": from_minor(balance)}
+
+    def deposit(self, amount):
+        """Journal a single deposit (quiet, no print)."""
+        return self.post_batch([(self.DEPOSIT, amount)])["balance"]
+
+    def withdraw(self, amount):
+        """Journal a single withdrawal (quiet, no print)."""
+        return self.post_batch([(self.WITHDRAW, amount)])["balance"]
+
+    def history(self):
+        """Yield journal entries as ("opening" | "deposit" | "withdraw", Money amount)."""
+        names = {self.OPENING: "opening", self.DEPOSIT: "deposit", self.WITHDRAW: "withdraw"}
+        for kind, amount in zip(self._kinds, self._amounts):
+            yield names[kind], Money(amount)
+
+    def __len__(self):
+        """Number of entries in the journal."""
+        return len(self._kinds)
+
+
+# -------------------- CONCURRENT ACCOUNTS --------------------
+
+class ConcurrentBankRegistry:
+    """
+    Thread-safe registry of BankAccount objects using lock striping.
+
+    - Each account id maps to one of `stripes` locks (id hash % stripes).
+    - Operations on accounts in different stripes run in parallel.
+    - transfer() acquires the two stripes in ascending order, so two
+      opposite transfers can never wait on each other forever.
+    """
+
+    def __init__(self, stripes=64):
+        self._accounts = {}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._registry_lock = threading.Lock()  # guards open_account only
+
+    def _stripe(self, account_id):
+        """Index of the lock that guards this account."""
+        return hash(account_id) % len(self._locks)
+
+    def open_account(self, account_id, account_holder, balance=0):
+        """Register a new account; raises ValueError on a duplicate id."""
+        with self._registry_lock:
+            if account_id in self._accounts:
+                raise ValueError(f"Account {account_id} already exists.")
+            account = BankAccount(account_holder, balance)
+            self._accounts[account_id] = account
+            return account
+
+    def get(self, account_id):
+        """Return the BankAccount for an id (KeyError if missing)."""
+        return self._accounts[account_id]
+
+    def deposit(self, account_id, amount):
+        """Atomically add a positive amount. Returns True on success."""
+        if amount <= 0:
+            return False
+        account = self._accounts[account_id]
+        with self._locks[self._stripe(account_id)]:
+            account._adjust(amount)
+        return True
+
+    def withdraw(self, account_id, amount):
+        """Atomically withdraw if funds allow. Returns True on success."""
+        if amount <= 0:
+            return False
+        account = self._accounts[account_id]
+        with self._locks[self._stripe(account_id)]:
+            if amount > account.balance:
+                return False
+            account._adjust(-amount)
+        return True
+
+    def transfer(self, src, dst, amount):
+        """
+        Atomically move `amount` from src to dst.
+        - Both stripes are locked in ascending index order.
+        - If both accounts share a stripe, that lock is taken once.
+        Returns True on success, False if invalid or insufficient funds.
+        """
+        if amount <= 0 or src == dst:
+            return False
+        source, target = self._accounts[src], self._accounts[dst]
+        first, second = sorted((self._stripe(src), self._stripe(dst)))
+        with self._locks[first]:
+            if second != first:
+                self._locks[second].acquire()
+            try:
+                if amount > source.balance:
+                    return False
+                source._adjust(-amount)
+                target._adjust(amount)
+                return True
+            finally:
+                if second != first:
+                    self._locks[second].release()
+
+    def total_balance(self):
+        """Sum of all balances (call when no workers are running)."""
+        return sum(account.balance for account in self._accounts.values())
+
+    def __len__(self):
+        return len(self._accounts)
+
+
+def run_stress_benchmark(num_accounts=1000, num_threads=8,
+                         ops_per_thread=20000, stripes=64, seed=42):
+    """
+    Multi-threaded stress benchmark for ConcurrentBankRegistry.
+    - Workers run a random mix of deposits, withdrawals and transfers.
+    - Deposits are tallied so the final total can be checked exactly:
+      transfers and rejected withdrawals must never create or lose money.
+    Returns a dict with ops/sec and the consistency check result.
+    """
+    registry = ConcurrentBankRegistry(stripes=stripes)
+    for account_id in range(num_accounts):
+        registry.open_account(account_id, f"Holder-{account_id}", 1000)
+    expected = registry.total_balance()
+    deltas = [0] * num_threads
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        delta = 0
+        for _ in range(ops_per_thread):
+            op = rng.random()
+            a = rng.randrange(num_accounts)
+            amount = rng.randint(1, 500)
+            if op < 0.2:
+                if registry.deposit(a, amount):
+                    delta += amount
+            elif op < 0.4:
+                if registry.withdraw(a, amount):
+                    delta -= amount
+            else:
+                registry.transfer(a, rng.randrange(num_accounts), amount)
+        deltas[index] = delta
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total_ops = num_threads * ops_per_thread
+    final = registry.total_balance()
+    return {
+        "threads": num_threads,
+        "stripes": stripes,
+        "ops": total_ops,
+        "seconds": round(elapsed, 3),
+        "ops_per_sec": round(total_ops / elapsed),
+        "consistent": final == expected + sum(deltas),
+        "no_overdraft": all(registry.get(i).balance >= 0 for i in range(num_accounts)),
+    }
+
+
+# -------------------- COLUMNAR ACCOUNT STORE --------------------
+
+class AccountStore:
+    """
+    Columnar storage for many accounts.
+
+    - holder_ids: int64 array of account holder ids
+    - balances:   int64 array of balances in cents (exact, no float drift)
+    - Arrays grow by doubling, so add_accounts() is amortized O(1) per row.
+    """
+
+    def __init__(self, capacity=1024):
+        if np is None:
+            raise ImportError("AccountStore requires NumPy (pip install numpy).")
+        self._holder_ids = np.zeros(capacity, dtype=np.int64)
+        self._balances = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+
+    @property
+    def holder_ids(self):
+        """Read-only view of the active holder ids."""
+        view = self._holder_ids[:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def balances(self):
+        """Active balances in cents (a view, so writes go to the store)."""
+        return self._balances[:self._size]
+
+    def _reserve(self, extra):
+        """Grow the arrays so `extra` more rows fit."""
+        needed = self._size + extra
+        capacity = len(self._balances)
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)  # a store created with capacity=0 must still grow
+        while capacity < needed:
+            capacity *= 2
+        self._holder_ids = np.resize(self._holder_ids, capacity)
+        self._balances = np.resize(self._balances, capacity)
+
+    def add_accounts(self, holder_ids, balances_cents):
+        """Append many accounts at once. Returns the first new index."""
+        holder_ids = np.asarray(holder_ids, dtype=np.int64)
+        balances_cents = np.asarray(balances_cents, dtype=np.int64)
+        if holder_ids.shape != balances_cents.shape:
+            raise ValueError("holder_ids and balances must have the same length.")
+        self._reserve(len(holder_ids))
+        start, end = self._size, self._size + len(holder_ids)
+        self._holder_ids[start:end] = holder_ids
+        self._balances[start:end] = balances_cents
+        self._size = end
+        return start
+
+    def add_account(self, holder_id, balance=0):
+        """Append one account (balance in currency units). Returns its view."""
+        index = self.add_accounts([holder_id], [to_minor(balance)])
+        return self[index]
+
+    def apply_interest(self, rate):
+        """Credit interest at `rate` (e.g. 0.01 for 1%) on positive balances."""
+        b = self.balances
+        b += np.rint(np.where(b > 0, b * rate, 0)).astype(np.int64)
+
+    def charge_fee(self, mask, amount):
+        """Deduct a fee (currency units) from every account where mask is True."""
+        fee = to_minor(amount)
+        b = self.balances
+        np.subtract(b, fee, out=b, where=np.asarray(mask, dtype=bool))
+
+    def overdraft_report(self):
+        """
+        Summarize overdrawn accounts (balance < 0).
+        Returns a dict: count, total_overdraft (currency units),
+        holder_ids and balances (cents) of the overdrawn accounts.
+        """
+        b = self.balances
+        overdrawn = b < 0
+        return {
+            "count": int(overdrawn.sum()),
+            "total_overdraft": from_minor(-int(b[overdrawn].sum())),
+            "holder_ids": self.holder_ids[overdrawn],
+            "balances": b[overdrawn],
+        }
+
+    def __getitem__(self, index):
+        if not -self._size <= index < self._size:
+            raise IndexError("account index out of range")
+        return AccountView(self, index % self._size)
+
+    def __len__(self):
+        return self._size
+
+
+class AccountView(BankAccount):
+    """
+    A BankAccount-like view of one row in an AccountStore.
+
+    - account_holder and minor (the balance in cents) are properties
+      backed by the arrays, so balance, deposit(), withdraw(),
+      check_balance() and __str__ are inherited from BankAccount unchanged.
+    """
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    @property
+    def account_holder(self):
+        return int(self._store._holder_ids[self._index])
+
+    @property
+    def minor(self):
+        return int(self._store._balances[self._index])
+
+    @minor.setter
+    def minor(self, value):
+        self._store._balances[self._index] = value
+
+
+# -------------------- DURABLE STORE (SNAPSHOT + WAL) --------------------
+
+class DurableBankStore:
+    """
+    Crash-safe account storage: periodic snapshots plus a write-ahead log.
+
+    Files inside `directory`:
+    - snapshot.bin: compact binary image of every account, tagged with the
+      sequence number of the last operation it includes.
+    - wal.log: operations after that snapshot, one checksummed record each.
+
+    - Every operation is validated, applied in memory and appended to the
+      WAL buffer. The buffer is written and fsync'd once per `group_size`
+      records (group commit) or when commit() / close() is called, so an
+      operation is durable only after the group containing it is committed.
+    - Every `snapshot_every` operations a new snapshot is written and the
+      WAL is truncated, so recovery reads one snapshot plus a short tail,
+      no matter how long the store has been running.
+    - A torn record at the end of the WAL (crash mid-write) is detected by
+      its checksum and dropped during recovery.
+    - Amounts and balances are stored as integer minor units (cents), so
+      replay is exact; account.balance is a plain number again (an int for
+      whole amounts) and account.minor holds the exact cents.
+    """
+
+    OPEN, DEPOSIT, WITHDRAW, TRANSFER = 1, 2, 3, 4
+
+    _HEADER = struct.Struct("<II")       # payload length, crc32
+    _OP = struct.Struct("<QB")           # sequence number, op code
+    _AMOUNT = struct.Struct("<Qq")       # account id, amount (minor units)
+    _TRANSFER = struct.Struct("<QQq")    # source id, target id, amount (minor units)
+    _ACCOUNT = struct.Struct("<QqHH")    # id, balance (minor units), holder len, contact len
+    _SNAPSHOT_MAGIC = b"BSNP2"
+    _MAX_MINOR = 2 ** 63 - 1
+
+    def __init__(self, directory, group_size=64, snapshot_every=10000):
+        self.directory = directory
+        self.group_size = group_size
+        self.snapshot_every = snapshot_every
+        self.accounts = {}   # account id -> BankAccount (with .contact)
+        self._seq = 0
+        self._ops_since_snapshot = 0
+        self._pending = bytearray()
+        self._pending_count = 0
+        os.makedirs(directory, exist_ok=True)
+        self._snapshot_path = os.path.join(directory, "snapshot.bin")
+        self._wal_path = os.path.join(directory, "wal.log")
+        self._recover()
+        self._wal = open(self._wal_path, "ab")
+
+    # ---------- Public operations ----------
+
+    def open_account(self, account_id, account_holder, contact="", balance=0):
+        """
+        Create an account. Returns False if the id is already taken or the
+        record cannot be stored: the id must fit an unsigned 64-bit int and
+        the holder name and contact at most 65535 bytes each (UTF-8).
+        """
+        balance = self._to_minor(balance)
+        if (not isinstance(account_id, int) or not 0 <= account_id < 2 ** 64
+                or account_id in self.accounts or balance is None or balance < 0):
+            return False
+        holder, contact_bytes = account_holder.encode(), contact.encode()
+        if len(holder) > 0xFFFF or len(contact_bytes) > 0xFFFF:
+            return False
+        payload = (self._ACCOUNT.pack(account_id, balance, len(holder), len(contact_bytes))
+                   + holder + contact_bytes)
+        self._apply_open(account_id, account_holder, contact, balance)
+        self._log(self.OPEN, payload)
+        return True
+
+    def deposit(self, account_id, amount):
+        """Deposit a positive amount. Returns True on success."""
+        account, amount = self.accounts.get(account_id), self._to_minor(amount)
+        if (account is None or amount is None or amount <= 0
+                or account.minor + amount > self._MAX_MINOR):
+            return False
+        self._credit(account, amount)
+        self._log(self.DEPOSIT, self._AMOUNT.pack(account_id, amount))
+        return True
+
+    def withdraw(self, account_id, amount):
+        """Withdraw if funds allow. Returns True on success."""
+        account, amount = self.accounts.get(account_id), self._to_minor(amount)
+        if account is None or amount is None or amount <= 0 or amount > account.minor:
+            return False
+        self._credit(account, -amount)
+        self._log(self.WITHDRAW, self._AMOUNT.pack(account_id, amount))
+        return True
+
+    def transfer(self, src, dst, amount):
+        """Move money between two accounts. Returns True on success."""
+        source, target = self.accounts.get(src), self.accounts.get(dst)
+        amount = self._to_minor(amount)
+        if (source is None or target is None or src == dst or amount is None
+                or amount <= 0 or amount > source.minor
+                or target.minor + amount > self._MAX_MINOR):
+            return False
+        self._credit(source, -amount)
+        self._credit(target, amount)
+        self._log(self.TRANSFER, self._TRANSFER.pack(src, dst, amount))
+        return True
+
+    def commit(self):
+        """Write and fsync every buffered WAL record (one fsync per group)."""
+        if not self._pending:
+            return
+        self._wal.write(self._pending)
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+        self._pending.clear()
+        self._pending_count = 0
+
+    def snapshot(self):
+        """Write a new snapshot atomically, then start an empty WAL."""
+        self.commit()
+        parts = [self._SNAPSHOT_MAGIC, struct.pack("<QQ", self._seq, len(self.accounts))]
+        for account_id, account in self.accounts.items():
+            holder, contact = account.account_holder.encode(), account.contact.encode()
+            parts.append(self._ACCOUNT.pack(account_id, account.minor, len(holder), len(contact)))
+            parts.append(holder)
+            parts.append(contact)
+        body = b"".join(parts)
+        tmp_path = self._snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+            f.write(struct.pack("<I", zlib.crc32(body)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        # fsync the directory so the rename is durable before the WAL is
+        # emptied; otherwise a crash could keep the truncate but lose the
+        # rename, leaving the old snapshot with no log to replay.
+        dir_fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+        # Records up to self._seq are now in the snapshot; a crash before the
+        # truncate below is harmless because replay skips them by sequence.
+        self._wal.truncate(0)
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+        self._ops_since_snapshot = 0
+
+    def close(self):
+        """Commit pending records and close the WAL."""
+        self.commit()
+        self._wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- Internals ----------
+
+    def _to_minor(self, amount):
+        """Amount in minor units, or None if it is not a storable number."""
+        try:
+            minor = to_minor(amount)
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+        return minor if abs(minor) <= self._MAX_MINOR else None
+
+    @staticmethod
+    def _credit(account, minor):
+        account.minor += minor
+
+    def _apply_open(self, account_id, account_holder, contact, balance_minor):
+        account = BankAccount(account_holder)
+        account.minor = balance_minor
+        account.contact = contact
+        self.accounts[account_id] = account
+
+    def _log(self, op, payload):
+        """Append one record to the group-commit buffer."""
+        self._seq += 1
+        record = self._OP.pack(self._seq, op) + payload
+        self._pending += self._HEADER.pack(len(record), zlib.crc32(record))
+        self._pending += record
+        self._pending_count += 1
+        self._ops_since_snapshot += 1
+        if self._pending_count >= self.group_size:
+            self.commit()
+        if self._ops_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def _recover(self):
+        """Load the latest snapshot, then replay only the WAL tail."""
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, "rb") as f:
+                data = f.read()
+            body, crc = data[:-4], data[-4:]
+            if not body.startswith(self._SNAPSHOT_MAGIC) or struct.unpack("<I", crc)[0] != zlib.crc32(body):
+                raise ValueError(f"Corrupt snapshot: {self._snapshot_path}")
+            offset = len(self._SNAPSHOT_MAGIC)
+            self._seq, count = struct.unpack_from("<QQ", body, offset)
+            offset += 16
+            for _ in range(count):
+                account_id, balance, holder_len, contact_len = self._ACCOUNT.unpack_from(body, offset)
+                offset += self._ACCOUNT.size
+                holder = body[offset:offset + holder_len].decode()
+                offset += holder_len
+                contact = body[offset:offset + contact_len].decode()
+                offset += contact_len
+                self._apply_open(account_id, holder, contact, balance)
+
+        if not os.path.exists(self._wal_path):
+            return
+        with open(self._wal_path, "rb") as f:
+            data = f.read()
+        offset, good_end = 0, 0
+        while offset + self._HEADER.size <= len(data):
+            length, crc = self._HEADER.unpack_from(data, offset)
+            record = data[offset + self._HEADER.size:offset + self._HEADER.size + length]
+            if len(record) < length or zlib.crc32(record) != crc:
+                break  # torn or corrupt tail: everything after it is lost
+            offset += self._HEADER.size + length
+            good_end = offset
+            seq, op = self._OP.unpack_from(record)
+            if seq <= self._seq:
+                continue  # already contained in the snapshot
+            self._seq = seq
+            self._ops_since_snapshot += 1
+            self._replay(op, record, self._OP.size)
+        if good_end < len(data):
+            with open(self._wal_path, "r+b") as f:
+                f.truncate(good_end)
+
+    def _replay(self, op, record, offset):
+        """Re-apply one logged operation (already validated when logged)."""
+        if op == self.OPEN:
+            account_id, balance, holder_len, contact_len = self._ACCOUNT.unpack_from(record, offset)
+            offset += self._ACCOUNT.size
+            holder = record[offset:offset + holder_len].decode()
+            contact = record[offset + holder_len:offset + holder_len + contact_len].decode()
+            self._apply_open(account_id, holder, contact, balance)
+        elif op == self.TRANSFER:
+            src, dst, amount = self._TRANSFER.unpack_from(record, offset)
+            self._credit(self.accounts[src], -amount)
+            self._credit(self.accounts[dst], amount)
+        else:
+            account_id, amount = self._AMOUNT.unpack_from(record, offset)
+            self._credit(self.accounts[account_id], amount if op == self.DEPOSIT else -amount)
+
+
+# -------------------- ASYNC SERVICE (REQUEST COALESCING) --------------------
+
+class AsyncAccountService:
+    """
+    asyncio front-end that serves many concurrent clients over a local socket.
+
+    Protocol (one text line per request, one reply line per request):
+        DEPOSIT <account_id> <amount>   -> OK <balance> | ERR <reason>
+        WITHDRAW <account_id> <amount>  -> OK <balance> | ERR <reason>
+        BALANCE <account_id>            -> OK <balance> | ERR <reason>
+
+    - Requests are queued per account instead of being applied one by one.
+    - Once per event-loop tick the queue of every touched account is applied
+      against a local running balance and written back in a single update,
+      so a hot account gets one state change per tick, not one per request.
+    - A balance read with nothing queued is answered straight from the
+      account; otherwise it is answered in order within the coalesced batch.
+    - A request whose caller has already cancelled it (timeout, dropped
+      client) is skipped and not applied; the rest of the batch still is.
+    """
+
+    def __init__(self, accounts):
+        self.accounts = accounts          # account id -> BankAccount
+        self._pending = {}                # account id -> [(op, amount, future)]
+        self._flush_scheduled = False
+        self.requests = 0
+        self.state_updates = 0
+
+    async def submit(self, op, account_id, amount=0):
+        """Queue one request and wait for its result (new balance)."""
+        self.requests += 1
+        if account_id not in self.accounts:
+            raise KeyError("unknown account")
+        queue = self._pending.get(account_id)
+        if op == "BALANCE" and queue is None:
+            return self.accounts[account_id].balance  # nothing in flight
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if queue is None:
+            queue = self._pending[account_id] = []
+        queue.append((op, amount, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self):
+        """Apply every queued request, one balance write per account."""
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        for account_id, queue in pending.items():
+            account = self.accounts[account_id]
+            balance = account.minor  # exact cents while batching
+            for op, amount, future in queue:
+                if future.done():
+                    continue  # cancelled by the caller: skip it, keep the batch going
+                if op == "DEPOSIT":
+                    if amount <= 0:
+                        future.set_exception(ValueError("amount must be positive"))
+                        continue
+                    balance += to_minor(amount)
+                elif op == "WITHDRAW":
+                    if amount <= 0:
+                        future.set_exception(ValueError("amount must be positive"))
+                        continue
+                    if to_minor(amount) > balance:
+                        future.set_exception(ValueError("insufficient balance"))
+                        continue
+                    balance -= to_minor(amount)
+                future.set_result(from_minor(balance))
+            account.minor = balance
+            self.state_updates += 1
+
+    async def handle_client(self, reader, writer):
+        """Serve one client connection until it disconnects."""
+        try:
+            while line := await reader.readline():
+                try:
+                    parts = line.decode().split()
+                    op, account_id = parts[0].upper(), int(parts[1])
+                    if op not in ("DEPOSIT", "WITHDRAW", "BALANCE"):
+                        raise ValueError(f"unknown command {op}")
+                    amount = int(parts[2]) if op != "BALANCE" else 0
+                    reply = f"OK {await self.submit(op, account_id, amount)}"
+                except (IndexError, KeyError, ValueError) as e:
+                    reply = f"ERR {e}"
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        """Start the TCP server on the local interface."""
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+async def run_async_load_demo(num_clients=500, requests_per_client=40, hot_accounts=3):
+    """
+    Many concurrent client sessions against a handful of hot accounts.
+    Returns request count, throughput and how many state updates were
+    needed (the coalescing ratio is requests per update).
+    """
+    accounts = {i: BankAccount(f"Hot-{i}", 1_000_000) for i in range(hot_accounts)}
+    service = AsyncAccountService(accounts)
+    server = await service.serve(port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def client(seed):
+        rng = random.Random(seed)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for _ in range(requests_per_client):
+            op = rng.choice(("DEPOSIT", "WITHDRAW", "BALANCE"))
+            account_id = rng.randrange(hot_accounts)
+            amount = "" if op == "BALANCE" else f" {rng.randint(1, 100)}"
+            writer.write(f"{op} {account_id}{amount}\n".encode())
+            await writer.drain()
+            await reader.readline()
+        writer.close()
+        await writer.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(num_clients)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    return {
+        "clients": num_clients,
+        "requests": service.requests,
+        "state_updates": service.state_updates,
+        "requests_per_update": round(service.requests / max(service.state_updates, 1), 1),
+        "requests_per_sec": round(service.requests / elapsed),
+    }
+
+
+# -------------------- MULTI-PROCESS SHARDED ENGINE --------------------
+
+def _shard_worker(conn):
+    """
+    Worker process that owns one shard of the accounts.
+    Receives a list of commands per message and replies with a list of
+    results in the same order. Cross-shard transfers arrive as
+    prepare / commit / abort commands (two-phase commit).
+    """
+    accounts = {}   # account id -> BankAccount
+    holds = {}      # txid -> (kind, account id, amount) awaiting phase 2
+    while True:
+        commands = conn.recv()
+        if commands is None:
+            break
+        results = []
+        for command in commands:
+            op = command[0]
+            if op == "open":
+                _, account_id, holder, balance = command
+                ok = account_id not in accounts
+                if ok:
+                    accounts[account_id] = BankAccount(holder, balance)
+                results.append(ok)
+            elif op == "deposit" or op == "withdraw":
+                _, account_id, amount = command
+                account = accounts.get(account_id)
+                if account is None or amount <= 0 or (op == "withdraw" and amount > account.balance):
+                    results.append(False)
+                else:
+                    account._adjust(amount if op == "deposit" else -amount)
+                    results.append(True)
+            elif op == "balance":
+                account = accounts.get(command[1])
+                results.append(None if account is None else account.balance)
+            elif op == "transfer":  # both accounts live on this shard
+                _, src, dst, amount = command
+                source, target = accounts.get(src), accounts.get(dst)
+                if source is None or target is None or src == dst or amount <= 0 or amount > source.balance:
+                    results.append(False)
+                else:
+                    source._adjust(-amount)
+                    target._adjust(amount)
+                    results.append(True)
+            elif op == "prepare_debit":  # phase 1: reserve the money
+                _, txid, account_id, amount = command
+                account = accounts.get(account_id)
+                vote = account is not None and 0 < amount <= account.balance
+                if vote:
+                    account._adjust(-amount)
+                    holds[txid] = ("debit", account_id, amount)
+                results.append(vote)
+            elif op == "prepare_credit":  # phase 1: check the target exists
+                _, txid, account_id, amount = command
+                vote = account_id in accounts and amount > 0
+                if vote:
+                    holds[txid] = ("credit", account_id, amount)
+                results.append(vote)
+            elif op == "commit" or op == "abort":  # phase 2
+                hold = holds.pop(command[1], None)
+                if hold is not None:
+                    kind, account_id, amount = hold
+                    if op == "commit" and kind == "credit":
+                        accounts[account_id]._adjust(amount)
+                    elif op == "abort" and kind == "debit":
+                        accounts[account_id]._adjust(amount)
+                results.append(True)
+            else:
+                results.append(False)
+        conn.send(results)
+
+
+class ShardedBankEngine:
+    """
+    Accounts partitioned by account number over N worker processes.
+
+    - Account `a` lives on shard a % num_shards; each worker owns its
+      shard's BankAccount objects, so shards run on separate cores.
+    - execute(ops) routes a batch of operations: every shard receives
+      one message, all shards work in parallel, then replies are merged.
+    - A transfer between two shards uses two-phase commit: phase 1 sends
+      prepare_debit (funds are reserved) and prepare_credit (target
+      checked); phase 2 commits on both shards only if both voted yes,
+      otherwise aborts and the reserved funds are released.
+    """
+
+    def __init__(self, num_shards=4):
+        self.num_shards = num_shards
+        self._conns = []
+        self._workers = []
+        self._next_txid = 0
+        for _ in range(num_shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_shard_worker, args=(child_conn,), daemon=True)
+            worker.start()
+            self._conns.append(parent_conn)
+            self._workers.append(worker)
+
+    def shard_of(self, account_id):
+        return account_id % self.num_shards
+
+    def _round_trip(self, batches):
+        """Send one batch per shard, then collect all replies (parallel)."""
+        for shard, commands in enumerate(batches):
+            if commands:
+                self._conns[shard].send(commands)
+        return [self._conns[shard].recv() if commands else []
+                for shard, commands in enumerate(batches)]
+
+    def open_accounts(self, accounts):
+        """Open many accounts: iterable of (account_id, holder, balance)."""
+        return self.execute([("open", *account) for account in accounts])
+
+    def execute(self, ops):
+        """
+        Run a batch of operations and return their results in order.
+        ops: ("open", id, holder, balance) | ("deposit", id, amount) |
+             ("withdraw", id, amount) | ("balance", id) |
+             ("transfer", src, dst, amount)
+        Cross-shard transfers take effect at the end of the batch.
+        """
+        batches = [[] for _ in range(self.num_shards)]
+        routes = []           # per op: (shard, position) or ("2pc", txid)
+        transactions = {}     # txid -> ((src shard, pos), (dst shard, pos))
+        for op in ops:
+            if op[0] == "transfer" and self.shard_of(op[1]) != self.shard_of(op[2]):
+                _, src, dst, amount = op
+                txid = self._next_txid
+                self._next_txid += 1
+                src_shard, dst_shard = self.shard_of(src), self.shard_of(dst)
+                batches[src_shard].append(("prepare_debit", txid, src, amount))
+                batches[dst_shard].append(("prepare_credit", txid, dst, amount))
+                transactions[txid] = ((src_shard, len(batches[src_shard]) - 1),
+                                      (dst_shard, len(batches[dst_shard]) - 1))
+                routes.append(("2pc", txid))
+            else:
+                shard = self.shard_of(op[1])
+                batches[shard].append(op)
+                routes.append((shard, len(batches[shard]) - 1))
+
+        replies = self._round_trip(batches)  # phase 1 (and all local ops)
+
+        decisions = {}
+        if transactions:
+            phase_two = [[] for _ in range(self.num_shards)]
+            for txid, ((src_shard, src_pos), (dst_shard, dst_pos)) in transactions.items():
+                commit = replies[src_shard][src_pos] and replies[dst_shard][dst_pos]
+                decisions[txid] = commit
+                verb = "commit" if commit else "abort"
+                phase_two[src_shard].append((verb, txid))
+                phase_two[dst_shard].append((verb, txid))
+            self._round_trip(phase_two)   # phase 2
+
+        return [decisions[route[1]] if route[0] == "2pc" else replies[route[0]][route[1]]
+                for route in routes]
+
+    def close(self):
+        """Stop every worker process."""
+        for conn in self._conns:
+            conn.send(None)
+        for worker in self._workers:
+            worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_sharded_benchmark(num_shards=4, num_accounts=10000, num_ops=200000,
+                          batch_size=20000, seed=7):
+    """Transfer-heavy workload on a ShardedBankEngine; checks money is conserved."""
+    rng = random.Random(seed)
+    with ShardedBankEngine(num_shards) as engine:
+        engine.open_accounts((i, f"Holder-{i}", 1000) for i in range(num_accounts))
+        ops = [("transfer", rng.randrange(num_accounts), rng.randrange(num_accounts),
+                rng.randint(1, 300)) for _ in range(num_ops)]
+        start = time.perf_counter()
+        committed = 0
+        for i in range(0, num_ops, batch_size):
+            committed += sum(engine.execute(ops[i:i + batch_size]))
+        elapsed = time.perf_counter() - start
+        total = sum(engine.execute([("balance", i) for i in range(num_accounts)]))
+    return {
+        "shards": num_shards,
+        "ops": num_ops,
+        "committed": committed,
+        "ops_per_sec": round(num_ops / elapsed),
+        "money_conserved": total == num_accounts * 1000,
+    }
+
+
 # -------------------- TESTING SECTION --------------------
 
 if __name__ == "__main__":
@@ -99,3 +1119,54 @@ if __name__ == "__main__":
 
     # Final balance check
     account1.check_balance()
+
+    # -------------------- JOURNAL-BACKED ACCOUNT --------------------
+    ledger = LedgerBankAccount("Abdullah", 1000)
+    summary = ledger.post_batch([
+        ("deposit", 500),
+        ("withdraw", 2000),   # rejected: would overdraw
+        ("withdraw", 300),
+        ("deposit", -50),     # rejected: not positive
+    ])
+    print(f" Batch posted: {summary}")
+    print(f" Journal entries: {len(ledger)} -> {list(ledger.history())}")
+    ledger.check_balance()
+
+    # -------------------- CONCURRENT ACCOUNTS --------------------
+    registry = ConcurrentBankRegistry(stripes=16)
+    registry.open_account(1, "Yasir", 5000)
+    registry.open_account(2, "Abdullah", 100)
+    registry.transfer(1, 2, 1500)
+    print(f" After transfer: {registry.get(1)} | {registry.get(2)}")
+    print(f" Stress benchmark: {run_stress_benchmark(ops_per_thread=5000)}")
+
+    # -------------------- COLUMNAR ACCOUNT STORE --------------------
+    if np is not None:
+        store = AccountStore()
+        store.add_accounts(np.arange(1, 1_000_001), np.full(1_000_000, 50_000))
+        view = store.add_account(7, 20)
+        view.withdraw(15)
+        store.apply_interest(0.02)                      # +2% on positive balances
+        store.charge_fee(store.balances < 100_000, 10)  # 10.00 fee on small accounts
+        print(f" Store: {len(store)} accounts, first = {store[0]}")
+        print(f" Overdraft report: {store.overdraft_report()['count']} accounts overdrawn")
+    else:
+        print(" NumPy not installed: skipping AccountStore demo.")
+
+    # -------------------- DURABLE STORE (SNAPSHOT + WAL) --------------------
+    import tempfile
+    data_dir = tempfile.mkdtemp(prefix="bank_store_")
+    with DurableBankStore(data_dir, group_size=32, snapshot_every=1000) as durable:
+        durable.open_account(1, "Yasir", "0300-1234567", 1000)
+        durable.open_account(2, "Abdullah", "0311-7654321", 0)
+        for _ in range(2500):
+            durable.transfer(1, 2, 0.25)
+    recovered = DurableBankStore(data_dir)   # simulates a restart
+    print(f" Recovered after restart: {recovered.accounts[1]} | {recovered.accounts[2]}")
+    recovered.close()
+
+    # -------------------- ASYNC SERVICE (REQUEST COALESCING) --------------------
+    print(f" Async load demo: {asyncio.run(run_async_load_demo())}")
+
+    # -------------------- MULTI-PROCESS SHARDED ENGINE --------------------
+    print(f" Sharded engine: {run_sharded_benchmark()}")
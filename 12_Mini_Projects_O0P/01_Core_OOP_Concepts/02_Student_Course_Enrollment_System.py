@@ -31,53 +31,566 @@ Concepts Demonstrated:
 - Classes and Objects (OOP fundamentals)
 - Encapsulation (storing student & course details safely)
 - Object Relationships (Student ↔ Course link each other)
+
+Enrollment Index:
+-----------------
+Enrollments live in an EnrollmentRegistry: a bidirectional index keyed by
+student_id and course_code. Enrolling and checking membership are O(1),
+so bulk registration stays linear instead of quadratic.
+
+Bulk Registration:
+------------------
+EnrollmentRegistry.bulk_enroll(pairs) takes (student_id, course_code) pairs,
+dedupes them in one pass and returns a summary dict without printing per
+row. load_csv(path) streams such pairs from a large CSV file.
+
+Capacity & Waitlists:
+---------------------
+A Course can have a capacity. Requests beyond it go to a per-course
+waitlist kept in a heap, ordered by priority (higher first) and then by
+arrival. drop() removes an enrollment in O(1) through the index and
+promotes the top waitlisted student in O(log n).
+
+Co-enrollment Analytics (requires NumPy):
+-----------------------------------------
+CoEnrollmentMatrix turns a registry into a sparse student x course
+incidence matrix (CSR arrays) and answers timetable planning queries:
+courses most co-taken with X, students sharing >= k courses, per-course
+counts and the course x course co-enrollment counts (sparse COO arrays,
+or a dense matrix on request).
+
+Timetable Conflicts:
+--------------------
+Courses can have weekly meeting slots, e.g. [("Mon", "09:00", "10:30")].
+Each student keeps a sorted interval set of booked slots, so an enrollment
+that clashes is rejected with an O(log k) check. find_conflicts() scans
+the whole registry with a sweep-line pass per student. A course whose own
+slots overlap is rejected with ValueError, which keeps the intervals disjoint.
 """
 
+import bisect
+import csv
+import heapq
+import itertools
+import time
+
+try:
+    import numpy as np
+except ImportError:  # only CoEnrollmentMatrix needs NumPy
+    np = None
+
+ENROLLED = "enrolled"
+WAITLISTED = "waitlisted"
+ALREADY = "already"
+CONFLICT = "conflict"
+
+
+DAYS = {"Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6}
+
+
+def time_slot(day, start, end):
+    """
+    Convert ("Mon", "09:00", "10:30") into a half-open interval of minutes
+    since Monday 00:00, e.g. (540, 630). Intervals that merely touch
+    (one ends at 10:30, the next starts at 10:30) do not clash.
+    """
+    def minutes(hh_mm):
+        hours, mins = hh_mm.split(":")
+        return int(hours) * 60 + int(mins)
+
+    base = DAYS[day] * 24 * 60
+    interval = (base + minutes(start), base + minutes(end))
+    if interval[0] >= interval[1]:
+        raise ValueError(f"Slot must end after it starts: {day} {start}-{end}")
+    return interval
+
+
+def course_slots(slots):
+    """
+    Convert a course's meeting slots with time_slot(), sorted by start.
+    A course's own slots must not overlap each other: StudentSchedule
+    relies on every booked interval being disjoint.
+    """
+    intervals = sorted(time_slot(*slot) for slot in slots)
+    for (_, prev_end), (start, _) in zip(intervals, intervals[1:]):
+        if start < prev_end:
+            raise ValueError(f"Course slots overlap: {slots}")
+    return intervals
+
+
+class StudentSchedule:
+    """
+    A student's booked meeting times as a sorted set of disjoint intervals.
+
+    Three parallel lists sorted by start time; a clash check for one slot
+    is a single bisect plus a look at the two neighbours: O(log k).
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.codes = []
+
+    def clash(self, start, end):
+        """Course code that overlaps [start, end), or None."""
+        i = bisect.bisect_right(self.starts, start)
+        if i > 0 and self.ends[i - 1] > start:
+            return self.codes[i - 1]
+        if i < len(self.starts) and self.starts[i] < end:
+            return self.codes[i]
+        return None
+
+    def first_clash(self, slots):
+        """First course code clashing with any of `slots`, or None."""
+        for start, end in slots:
+            code = self.clash(start, end)
+            if code is not None:
+                return code
+        return None
+
+    def add(self, slots, course_code):
+        for start, end in slots:
+            i = bisect.bisect_right(self.starts, start)
+            self.starts.insert(i, start)
+            self.ends.insert(i, end)
+            self.codes.insert(i, course_code)
+
+    def remove(self, slots, course_code):
+        for start, end in slots:
+            i = bisect.bisect_left(self.starts, start)
+            while self.codes[i] != course_code:
+                i += 1
+            del self.starts[i], self.ends[i], self.codes[i]
+
+class EnrollmentRegistry:
+    """
+    Bidirectional enrollment index (O(1) membership and insertion).
+
+    - students: student_id -> Student
+    - courses:  course_code -> Course
+    - _courses_of: student_id -> {course_code: None}
+    - _students_of: course_code -> {student_id: None}
+    - _waitlists: course_code -> heap of [-priority, arrival, student_id]
+    - _waiting: course_code -> {student_id: heap entry}
+
+    The inner dicts are used as ordered sets: lookups and inserts are O(1)
+    like a set, and iteration keeps enrollment order for display.
+    Leaving a waitlist blanks the heap entry (lazy deletion); blank
+    entries are skipped when they reach the top of the heap.
+    """
+
+    def __init__(self):
+        self.students = {}
+        self.courses = {}
+        self._courses_of = {}
+        self._students_of = {}
+        self._waitlists = {}
+        self._waiting = {}
+        self._arrival = itertools.count()  # tie-breaker: earlier request first
+        self._schedules = {}  # student_id -> StudentSchedule (timed courses only)
+
+    def add_student(self, student):
+        """Register a student (idempotent)."""
+        if student.student_id not in self.students:
+            self.students[student.student_id] = student
+            self._courses_of[student.student_id] = {}
+
+    def add_course(self, course):
+        """Register a course (idempotent)."""
+        if course.course_code not in self.courses:
+            self.courses[course.course_code] = course
+            self._students_of[course.course_code] = {}
+            self._waitlists[course.course_code] = []
+            self._waiting[course.course_code] = {}
+
+    def is_enrolled(self, student_id, course_code):
+        """O(1) membership check."""
+        return course_code in self._courses_of.get(student_id, ())
+
+    def _is_full(self, course_code):
+        capacity = self.courses[course_code].capacity
+        return capacity is not None and len(self._students_of[course_code]) >= capacity
+
+    def clash(self, student_id, course_code):
+        """Code of an enrolled course that clashes with `course_code`, or None."""
+        slots = self.courses[course_code].slots
+        schedule = self._schedules.get(student_id)
+        if not slots or schedule is None:
+            return None
+        return schedule.first_clash(slots)
+
+    def _book(self, student_id, course_code):
+        """Record the enrollment in both indexes and the student's schedule."""
+        self._courses_of[student_id][course_code] = None
+        self._students_of[course_code][student_id] = None
+        slots = self.courses[course_code].slots
+        if slots:
+            schedule = self._schedules.get(student_id)
+            if schedule is None:
+                schedule = self._schedules[student_id] = StudentSchedule()
+            schedule.add(slots, course_code)
+
+    def _add_to_waitlist(self, student_id, course_code, priority):
+        entry = [-priority, next(self._arrival), student_id]
+        heapq.heappush(self._waitlists[course_code], entry)
+        self._waiting[course_code][student_id] = entry
+
+    def enroll(self, student, course, priority=0):
+        """
+        Link student and course in both directions, or waitlist the
+        student if the course is full. A course whose slots clash with
+        the student's timetable is rejected.
+        Returns ENROLLED, WAITLISTED, ALREADY (enrolled or waiting) or CONFLICT.
+        """
+        self.add_student(student)
+        self.add_course(course)
+        student_id, course_code = student.student_id, course.course_code
+        courses = self._courses_of[student_id]
+        if course_code in courses or student_id in self._waiting[course_code]:
+            return ALREADY
+        if self.clash(student_id, course_code) is not None:
+            return CONFLICT
+        if self._is_full(course_code):
+            self._add_to_waitlist(student_id, course_code, priority)
+            return WAITLISTED
+        self._book(student_id, course_code)
+        return ENROLLED
+
+    def drop(self, student_id, course_code):
+        """
+        Remove an enrollment in O(1) and promote the top waitlisted
+        student (O(log n)). Returns (removed, promoted): whether the
+        student was enrolled or waitlisted, and the promoted Student or None.
+        A student who is only waitlisted is just taken off the waitlist.
+        """
+        entry = self._waiting.get(course_code, {}).pop(student_id, None)
+        if entry is not None:
+            entry[2] = None  # lazy deletion from the heap
+            return True, None
+        if self._courses_of.get(student_id, {}).pop(course_code, False) is False:
+            return False, None
+        del self._students_of[course_code][student_id]
+        slots = self.courses[course_code].slots
+        if slots:
+            self._schedules[student_id].remove(slots, course_code)
+        return True, self._promote(course_code)
+
+    def _promote(self, course_code):
+        """
+        Move the highest-priority waitlisted student into a free seat.
+        Students whose timetable now clashes with the course are skipped
+        and removed from the waitlist.
+        """
+        heap, waiting = self._waitlists[course_code], self._waiting[course_code]
+        while heap and not self._is_full(course_code):
+            student_id = heapq.heappop(heap)[2]
+            if student_id is None:
+                continue  # left the waitlist earlier
+            del waiting[student_id]
+            if self.clash(student_id, course_code) is not None:
+                continue
+            self._book(student_id, course_code)
+            return self.students[student_id]
+        return None
+
+    def waitlist_of(self, course_code):
+        """Waitlisted Student objects in promotion order (sorted copy)."""
+        return [self.students[e[2]] for e in sorted(self._waitlists.get(course_code, ()))
+                if e[2] is not None]
+
+    def bulk_enroll(self, pairs, create_missing=False):
+        """
+        Enroll many (student_id, course_code) pairs in one pass, quietly.
+        - Duplicate pairs (in the input or already enrolled) are skipped.
+        - Unknown ids are skipped, or registered with placeholder names
+          when create_missing=True.
+        - Pairs for a full course go to its waitlist (priority 0).
+        Returns a summary dict of counts.
+        """
+        courses_of, students_of, waiting = self._courses_of, self._students_of, self._waiting
+        enrolled = waitlisted = duplicates = conflicts = unknown_students = unknown_courses = 0
+        for student_id, course_code in pairs:
+            courses = courses_of.get(student_id)
+            if courses is None:
+                if not create_missing:
+                    unknown_students += 1
+                    continue
+                Student(student_id, student_id, registry=self)
+                courses = courses_of[student_id]
+            students = students_of.get(course_code)
+            if students is None:
+                if not create_missing:
+                    unknown_courses += 1
+                    continue
+                Course(course_code, course_code, registry=self)
+                students = students_of[course_code]
+            if course_code in courses or student_id in waiting[course_code]:
+                duplicates += 1
+                continue
+            course = self.courses[course_code]
+            if course.slots and self.clash(student_id, course_code) is not None:
+                conflicts += 1
+                continue
+            if course.capacity is not None and len(students) >= course.capacity:
+                self._add_to_waitlist(student_id, course_code, 0)
+                waitlisted += 1
+                continue
+            if course.slots:
+                self._book(student_id, course_code)
+            else:
+                courses[course_code] = None
+                students[student_id] = None
+            enrolled += 1
+        return {
+            "enrolled": enrolled,
+            "waitlisted": waitlisted,
+            "duplicates": duplicates,
+            "conflicts": conflicts,
+            "unknown_students": unknown_students,
+            "unknown_courses": unknown_courses,
+        }
+
+    def load_csv(self, path, create_missing=False):
+        """
+        Stream (student_id, course_code) rows from a CSV file into
+        bulk_enroll(). A header row naming those columns is optional.
+        The file is read row by row, never loaded whole into memory.
+        """
+        start = time.perf_counter()
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = csv.reader(f)
+            first = next(rows, None)
+            if first is None:
+                return self.bulk_enroll((), create_missing)
+            if first[:2] != ["student_id", "course_code"]:
+                rows = itertools.chain([first], rows)
+            summary = self.bulk_enroll(((r[0], r[1]) for r in rows if len(r) >= 2), create_missing)
+        summary["seconds"] = round(time.perf_counter() - start, 3)
+        return summary
+
+    def find_conflicts(self):
+        """
+        Batch validator: every clashing pair of enrolled courses in the
+        registry, as (student_id, course_a, course_b).
+        Per student, all meeting slots are sorted by start and swept once
+        while a min-heap holds the slots still running (keyed by end time);
+        O(n log n + clashes) over all slots.
+        """
+        clashes = []
+        courses = self.courses
+        for student_id, codes in self._courses_of.items():
+            slots = sorted((start, end, code) for code in codes
+                           for start, end in courses[code].slots)
+            active, seen = [], set()
+            for start, end, code in slots:
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)  # finished before this slot starts
+                for _, other in active:
+                    pair = (other, code) if other < code else (code, other)
+                    if other != code and pair not in seen:
+                        seen.add(pair)
+                        clashes.append((student_id, *pair))
+                heapq.heappush(active, (end, code))
+        return clashes
+
+    def courses_of(self, student_id):
+        """Course objects a student is enrolled in (enrollment order)."""
+        return [self.courses[code] for code in self._courses_of.get(student_id, ())]
+
+    def students_in(self, course_code):
+        """Student objects enrolled in a course (enrollment order)."""
+        return [self.students[sid] for sid in self._students_of.get(course_code, ())]
+
+
+class CoEnrollmentMatrix:
+    """
+    Sparse student x course incidence matrix in CSR form (requires NumPy).
+
+    - Student rows: s_indptr / s_indices (course index per enrollment)
+    - Course rows (the transpose): c_indptr / c_indices (student index)
+    Queries gather whole rows at once and count with np.bincount, so
+    nothing loops over enrolled_students in Python.
+    Build a new matrix after the registry changes (it is a snapshot).
+    """
+
+    def __init__(self, registry):
+        if np is None:
+            raise ImportError("CoEnrollmentMatrix requires NumPy (pip install numpy).")
+        self.student_ids = list(registry._courses_of)
+        self.course_codes = list(registry._students_of)
+        course_index = {code: i for i, code in enumerate(self.course_codes)}
+        self._student_index = {sid: i for i, sid in enumerate(self.student_ids)}
+        self._course_index = course_index
+
+        per_student = registry._courses_of.values()
+        lengths = np.fromiter((len(c) for c in per_student), dtype=np.int64,
+                              count=len(self.student_ids))
+        nnz = int(lengths.sum())
+        self.s_indptr = np.concatenate(([0], np.cumsum(lengths)))
+        self.s_indices = np.fromiter((course_index[code] for c in per_student for code in c),
+                                     dtype=np.int64, count=nnz)
+
+        # Transpose: sort the entries by course to get course rows
+        rows = np.repeat(np.arange(len(self.student_ids)), lengths)
+        order = np.argsort(self.s_indices, kind="stable")
+        self.c_indices = rows[order]
+        counts = np.bincount(self.s_indices, minlength=len(self.course_codes))
+        self.c_indptr = np.concatenate(([0], np.cumsum(counts)))
+
+    @staticmethod
+    def _gather(indptr, indices, rows):
+        """Concatenate the column indices of many CSR rows, vectorized."""
+        starts = indptr[rows]
+        lengths = indptr[rows + 1] - starts
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return indices[np.repeat(starts, lengths) + offsets]
+
+    def course_counts(self):
+        """Number of students enrolled in each course."""
+        counts = np.diff(self.c_indptr)
+        return dict(zip(self.course_codes, counts.tolist()))
+
+    def co_taken_with(self, course_code, top=5):
+        """Courses most often taken together with `course_code` (code, count)."""
+        c = self._course_index[course_code]
+        students = self.c_indices[self.c_indptr[c]:self.c_indptr[c + 1]]
+        counts = np.bincount(self._gather(self.s_indptr, self.s_indices, students),
+                             minlength=len(self.course_codes))
+        counts[c] = 0
+        best = np.argsort(-counts, kind="stable")[:top]
+        return [(self.course_codes[i], int(counts[i])) for i in best if counts[i] > 0]
+
+    def students_sharing(self, student_id, k):
+        """Other students sharing at least k courses with `student_id` (id, shared)."""
+        s = self._student_index[student_id]
+        courses = self.s_indices[self.s_indptr[s]:self.s_indptr[s + 1]]
+        shared = np.bincount(self._gather(self.c_indptr, self.c_indices, courses),
+                             minlength=len(self.student_ids))
+        shared[s] = 0
+        hits = np.flatnonzero(shared >= k)
+        return [(self.student_ids[i], int(shared[i])) for i in hits]
+
+    def co_enrollment_counts(self, block=4096, dense=False):
+        """
+        Sparse course x course product A.T @ A in COO form: returns
+        (rows, cols, counts) arrays where counts[k] students take both
+        course rows[k] and cols[k] (a course paired with itself gives its
+        size). Only pairs that occur are stored, sorted by (row, col).
+        Every student row contributes the (i, j) pairs of its own courses,
+        expanded from the CSR arrays; each block of `block` students is
+        reduced to its distinct keys i * n_courses + j with np.unique,
+        and the blocks are merged once at the end, so the cost follows
+        the number of pairs, never n_courses^2.
+        dense=True returns the full n_courses x n_courses matrix instead.
+        """
+        n_students, n_courses = len(self.student_ids), len(self.course_codes)
+        lengths = np.diff(self.s_indptr)
+        keys, counts = [], []
+        for start in range(0, n_students, block):
+            stop = min(start + block, n_students)
+            entry_rows = np.repeat(np.arange(start, stop), lengths[start:stop])
+            left = np.repeat(self.s_indices[self.s_indptr[start]:self.s_indptr[stop]],
+                             lengths[entry_rows])
+            right = self._gather(self.s_indptr, self.s_indices, entry_rows)
+            block_keys, block_counts = np.unique(left * n_courses + right, return_counts=True)
+            keys.append(block_keys)
+            counts.append(block_counts)
+        if keys:
+            merged, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+            totals = np.bincount(inverse, weights=np.concatenate(counts)).astype(np.int64)
+        else:
+            merged = totals = np.zeros(0, dtype=np.int64)
+        rows, cols = np.divmod(merged, n_courses)
+        if not dense:
+            return rows, cols, totals
+        matrix = np.zeros((n_courses, n_courses), dtype=np.int64)
+        matrix[rows, cols] = totals
+        return matrix
+
+
+# Shared index used by Student and Course unless another registry is passed
+default_registry = EnrollmentRegistry()
+
+
 class Course:
-    def __init__(self, course_name, course_code):
-        """Initialize a course with name and code"""
+    def __init__(self, course_name, course_code, registry=None, capacity=None, slots=None):
+        """
+        Initialize a course with name, code, optional seat capacity and
+        optional weekly meeting slots such as [("Mon", "09:00", "10:30")]
+        (slots of one course must not overlap each other)
+        """
         self.course_name = course_name
         self.course_code = course_code
-        self.enrolled_students = []  # list of Student objects
+        self.capacity = capacity  # None = unlimited
+        self.slots = course_slots(slots) if slots else []
+        self.registry = registry or default_registry
+        self.registry.add_course(self)
 
-    def add_student(self, student):
-        """Enroll a student in this course"""
-        if student not in self.enrolled_students:
-            self.enrolled_students.append(student)
+    @property
+    def enrolled_students(self):
+        """List of Student objects, read from the enrollment index"""
+        return self.registry.students_in(self.course_code)
+
+    def add_student(self, student, priority=0):
+        """Enroll a student in this course (waitlist them if it is full)"""
+        status = self.registry.enroll(student, self, priority)
+        if status == ENROLLED:
             print(f" Student {student.name} enrolled in {self.course_name}")
+        elif status == WAITLISTED:
+            print(f" {self.course_name} is full. Student {student.name} added to the waitlist")
+        elif status == CONFLICT:
+            clash = self.registry.courses[self.registry.clash(student.student_id, self.course_code)]
+            print(f" {self.course_name} clashes with {clash.course_name} for Student {student.name}")
         else:
             print(f" Student {student.name} is already enrolled in {self.course_name}")
 
+    def drop(self, student):
+        """Drop a student; the top waitlisted student takes the seat"""
+        removed, promoted = self.registry.drop(student.student_id, self.course_code)
+        if not removed:
+            print(f" Student {student.name} is not enrolled in {self.course_name}")
+            return
+        print(f" Student {student.name} dropped {self.course_name}")
+        if promoted:
+            print(f" Student {promoted.name} promoted from the waitlist into {self.course_name}")
+
     def show_students(self):
         """Display all students enrolled in this course"""
-        if self.enrolled_students:
+        students = self.enrolled_students
+        if students:
             print(f"\n📘 Students in {self.course_name}:")
-            for s in self.enrolled_students:
+            for s in students:
                 print(f"- {s.name} (ID: {s.student_id})")
         else:
             print(f"\n No students enrolled in {self.course_name}")
 
 
 class Student:
-    def __init__(self, name, student_id):
+    def __init__(self, name, student_id, registry=None):
         """Initialize student with name and ID"""
         self.name = name
         self.student_id = student_id
-        self.enrolled_courses = []  # list of Course objects
+        self.registry = registry or default_registry
+        self.registry.add_student(self)
+
+    @property
+    def enrolled_courses(self):
+        """List of Course objects, read from the enrollment index"""
+        return self.registry.courses_of(self.student_id)
 
-    def enroll(self, course):
+    def enroll(self, course, priority=0):
         """Enroll this student in a course"""
-        if course not in self.enrolled_courses:
-            self.enrolled_courses.append(course)
-            course.add_student(self)
+        if not self.registry.is_enrolled(self.student_id, course.course_code):
+            course.add_student(self, priority)
         else:
             print(f" {self.name} is already enrolled in {course.course_name}")
 
     def show_courses(self):
         """Display all courses this student is enrolled in"""
-        if self.enrolled_courses:
+        courses = self.enrolled_courses
+        if courses:
             print(f"\n👨‍🎓 {self.name} (ID: {self.student_id}) is enrolled in:")
-            for c in self.enrolled_courses:
+            for c in courses:
                 print(f"- {c.course_name} ({c.course_code})")
         else:
             print(f"\n{self.name} is not enrolled in any course yet")
@@ -112,6 +625,54 @@ if __name__ == "__main__":
     math.show_students()
     physics.show_students()
 
+    # Capacity and waitlist: 1 seat, higher priority is promoted first
+    seminar = Course("AI Seminar", "AI500", capacity=1)
+    student3 = Student("Hassan", "H007")
+    student1.enroll(seminar)
+    student2.enroll(seminar)                  # waitlisted, priority 0
+    student3.enroll(seminar, priority=5)      # waitlisted, priority 5
+    seminar.drop(student1)                    # Hassan is promoted first
+    seminar.drop(student1)                    # no longer enrolled: nothing to drop
+    seminar.show_students()
+
+    # Timetable conflicts: overlapping meeting times are rejected
+    algo = Course("Algorithms", "CS301", slots=[("Mon", "09:00", "10:30"), ("Wed", "09:00", "10:30")])
+    ethics = Course("Ethics", "HUM110", slots=[("Wed", "10:00", "11:00")])
+    db = Course("Databases", "CS340", slots=[("Wed", "10:30", "12:00")])
+    student2.enroll(algo)
+    student2.enroll(ethics)                   # clashes with Algorithms on Wed
+    student2.enroll(db)                       # back-to-back is fine
+    print(" Registry-wide clashes:", default_registry.find_conflicts())
+    try:
+        Course("Lab", "LAB100", slots=[("Mon", "09:00", "12:00"), ("Mon", "09:30", "10:00")])
+    except ValueError as error:
+        print(" Rejected:", error)
+
+    # Bulk registration from a CSV file (no per-row printing)
+    import os
+    import tempfile
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["student_id", "course_code"])
+        for i in range(100000):
+            writer.writerow([f"S{i // 5}", f"C{i % 50}"])
+        writer.writerow(["S0", "C0"])  # duplicate row
+    bulk = EnrollmentRegistry()
+    print("\nBulk load summary:", bulk.load_csv(f.name, create_missing=True))
+    os.remove(f.name)
+
+    # Co-enrollment analytics over the bulk-loaded registry
+    if np is not None:
+        matrix = CoEnrollmentMatrix(bulk)
+        rows, cols, together = matrix.co_enrollment_counts()
+        print("Courses most co-taken with C0:", matrix.co_taken_with("C0", top=3))
+        print("Students sharing >= 5 courses with S0:", len(matrix.students_sharing("S0", 5)))
+        print("Students in C0:", matrix.course_counts()["C0"],
+              "| C0 & C10 together:", int(together[(rows == 0) & (cols == 10)].sum()),
+              "| co-taken course pairs:", len(together))
+    else:
+        print("NumPy not installed: skipping co-enrollment analytics.")
+
 # ============================================================
 # Sample Output:
 # ============================================================
@@ -19,6 +19,38 @@ OOP Concepts Demonstrated:
    - Users interact with the library via methods without knowing internal data structure.
 5. Inheritance / Polymorphism:
    - Not used here, but can be added if we create specialized types of books or users.
+6. Indexing:
+   - add_book also files each book in hash indexes keyed by the casefold()'d title
+     and author, so borrow/return/find are O(1) dict lookups instead of a scan.
+   - A title can have several copies; borrow hands out any available copy.
+7. Keyword Search:
+   - search(query) uses an InvertedIndex (token -> sorted posting list) that add_book
+     updates incrementally. Queries are AND by default ("george orwell"), or OR when
+     the words are joined with "or" ("alchemist or python"); results are ranked by
+     term frequency. The index can be saved to disk and loaded at startup.
+8. Autocomplete:
+   - autocomplete(prefix) returns the top title completions from a TitleTrie whose
+     nodes cache their best k titles, so each keystroke costs O(len(prefix)).
+9. Concurrency:
+   - checkout / checkin / checkout_many are thread-safe for many branch terminals.
+     Titles share a fixed pool of striped locks; a cart takes its locks in
+     ascending order, so it is all-or-nothing and cannot deadlock.
+   - `python 03_Library_System.py --benchmark` runs a multi-threaded contention test.
+10. Large Catalogs:
+   - Book uses __slots__ (no per-object __dict__). load_catalog(path) streams a CSV or
+     JSONL catalog without printing, interns author strings, and reports the load
+     rate and resident memory: `python 03_Library_System.py --load catalog.csv`.
+11. Loans & Reservations:
+   - Every checkout gets a due date (loan_days later). Loans are kept in a min-heap
+     ordered by due date, so sweep_overdue() pops only the loans that have expired
+     instead of scanning every Book; returned copies leave stale heap entries that
+     are skipped (and compacted away when they pile up).
+   - reserve(title, patron) joins a per-title FIFO queue when no copy is free; a
+     returned copy goes straight to the first patron in the queue.
+12. Fuzzy Lookup:
+   - A TrigramIndex (3-character slice -> titles) shortlists titles that share
+     enough trigrams with a misspelled query; edit distance is computed only
+     for that shortlist. borrow_book prints "Did you mean ...?" suggestions.
 
 Example Run:
 
@@ -47,33 +79,548 @@ Library Books:
 3. Python Programming by John Zelle - Available
 """
 
+import argparse
+import bisect
+import contextlib
+import csv
+import heapq
+import io
+import itertools
+import json
+import os
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+
 # ------------------------
 # Class Definitions
 # ------------------------
 
 class Book:
     """Represents a book in the library (Class & Object Concept)"""
+    # Compact records: no per-object __dict__, which matters for millions of books
+    __slots__ = ("title", "author", "is_borrowed", "borrower", "due", "loan")
+
     def __init__(self, title, author):
         self.title = title
         self.author = author
         self.is_borrowed = False  # Encapsulation: controlled by methods
+        self.borrower = None      # patron holding the current loan
+        self.due = None           # due date of the current loan
+        self.loan = None          # id of the current loan (None when on the shelf)
 
     def __str__(self):
         """Return the string representation of the book"""
         status = "Borrowed" if self.is_borrowed else "Available"
+        if self.due is not None:
+            status += f" (due {self.due:%Y-%m-%d})"
         return f"{self.title} by {self.author} - {status}"
 
 
+class InvertedIndex:
+    """
+    Token -> posting list index for keyword search (Abstraction).
+
+    - Documents are numbered in the order they are added, so appending a
+      new document id keeps every posting list sorted with no re-sorting.
+    - Each posting list is a compact array of document ids plus a parallel
+      array of term frequencies (how often the token occurs in that doc).
+    - AND queries intersect the lists smallest-first using binary search;
+      OR queries take their union. Results are ranked by total term
+      frequency over the query tokens (ties: earlier document first).
+    - save() / load() store the index in a compact binary file, so it does
+      not need to be rebuilt at startup. Each document's text is fingerprinted
+      (CRC-32 of the casefolded text), so a saved index can be checked
+      against the catalog it is loaded for.
+    """
+
+    TOKEN = re.compile(r"\w+")
+    MAGIC = b"LIDX2"
+
+    def __init__(self):
+        self.doc_count = 0
+        self._postings = {}   # token -> array("I") of doc ids (sorted)
+        self._freqs = {}      # token -> array("H") of term frequencies
+        self._fingerprints = array("I")  # doc id -> CRC-32 of its casefolded text
+
+    def tokenize(self, text):
+        return self.TOKEN.findall(text.casefold())
+
+    @staticmethod
+    def fingerprint(text):
+        return zlib.crc32(text.casefold().encode("utf-8"))
+
+    def matches(self, doc_id, text):
+        """True if `doc_id` is already indexed with this same text."""
+        return doc_id < self.doc_count and self._fingerprints[doc_id] == self.fingerprint(text)
+
+    def add(self, doc_id, text):
+        """
+        Index one document. Ids already covered by a loaded index are
+        skipped; check matches() first to catch an index that is stale.
+        """
+        if doc_id < self.doc_count:
+            return
+        self._fingerprints.append(self.fingerprint(text))
+        counts = {}
+        for token in self.tokenize(text):
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array("I")
+                self._freqs[token] = array("H")
+            postings.append(doc_id)
+            self._freqs[token].append(min(tf, 65535))
+        self.doc_count = doc_id + 1
+
+    def search(self, query, mode="and"):
+        """
+        Return [(doc_id, score), ...] best first.
+        - mode "and": documents containing every query token
+        - mode "or":  documents containing any query token
+        """
+        tokens = list(dict.fromkeys(self.tokenize(query)))
+        lists = [(self._postings.get(t, array("I")), self._freqs.get(t, array("H"))) for t in tokens]
+        if not lists:
+            return []
+        if mode == "and":
+            lists.sort(key=lambda pair: len(pair[0]))
+            docs = list(lists[0][0])
+            for postings, _ in lists[1:]:
+                docs = self._intersect(docs, postings)
+                if not docs:
+                    return []
+        else:
+            docs = sorted(set().union(*(postings for postings, _ in lists)))
+        scores = dict.fromkeys(docs, 0)
+        for postings, freqs in lists:
+            for doc in docs:
+                i = bisect.bisect_left(postings, doc)
+                if i < len(postings) and postings[i] == doc:
+                    scores[doc] += freqs[i]
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    @staticmethod
+    def _intersect(small, large):
+        """Ids of sorted `small` also found in sorted `large` (binary search)."""
+        result, lo = [], 0
+        for doc in small:
+            lo = bisect.bisect_left(large, doc, lo)
+            if lo == len(large):
+                break
+            if large[lo] == doc:
+                result.append(doc)
+        return result
+
+    def save(self, path):
+        """Write the index as: magic, JSON header, raw posting/frequency/fingerprint arrays."""
+        terms = [[token, len(postings)] for token, postings in self._postings.items()]
+        header = json.dumps({"doc_count": self.doc_count, "terms": terms}).encode()
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for token, _ in terms:
+                self._postings[token].tofile(f)
+            for token, _ in terms:
+                self._freqs[token].tofile(f)
+            self._fingerprints.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save()."""
+        index = cls()
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"Not a search index file: {path}")
+            (size,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(size))
+            index.doc_count = header["doc_count"]
+            for token, count in header["terms"]:
+                postings = index._postings[token] = array("I")
+                postings.fromfile(f, count)
+            for token, count in header["terms"]:
+                freqs = index._freqs[token] = array("H")
+                freqs.fromfile(f, count)
+            index._fingerprints.fromfile(f, index.doc_count)
+        return index
+
+
+class TitleTrie:
+    """
+    Prefix tree of casefolded titles for autocomplete (Abstraction).
+
+    - Every node caches the top-k titles below it, ranked by number of
+      copies (most first), then alphabetically. A lookup walks one node
+      per typed character and returns that cached list, so its cost
+      depends on the prefix length, not on the catalog size.
+    - add() walks the title's path once and refreshes each node's cache.
+    - Chains of single-child nodes are merged into one node whose edge
+      label holds several characters (a radix tree), so a catalog needs
+      at most about two nodes per distinct title.
+    """
+
+    class _Node:
+        __slots__ = ("label", "children", "top")
+
+        def __init__(self, label, top, children=None):
+            self.label = label        # characters on the edge into this node
+            self.children = children  # first char of child label -> node, or None
+            self.top = top            # [(-copies, key)] sorted, at most k entries
+
+    def __init__(self, k=10):
+        self.k = k
+        self._root = self._Node("", [])
+        self._display = {}  # key -> title as first added
+        self._copies = {}   # key -> number of copies
+
+    def add(self, title):
+        key = title.casefold()
+        self._display.setdefault(key, title)
+        copies = self._copies[key] = self._copies.get(key, 0) + 1
+        entry = (-copies, key)
+        node = self._root
+        self._offer(node, entry)
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i]) if node.children else None
+            if child is None:
+                if node.children is None:
+                    node.children = {}
+                node.children[key[i]] = self._Node(key[i:], [entry])
+                return
+            label = child.label
+            if key.startswith(label, i):  # common case: the whole edge matches
+                j = len(label)
+            else:
+                j = 1
+                while i + j < len(key) and label[j] == key[i + j]:
+                    j += 1
+            if j < len(label):  # split the edge where the key leaves it
+                middle = self._Node(label[:j], list(child.top), {label[j]: child})
+                child.label = label[j:]
+                node.children[key[i]] = middle
+                child = middle
+            self._offer(child, entry)
+            node = child
+            i += j
+
+    def _offer(self, node, entry):
+        """Put `entry` in the node's top-k cache if it ranks high enough."""
+        top = node.top
+        if len(top) >= self.k and entry >= top[-1]:
+            return  # cannot enter (a title already cached would rank above top[-1])
+        key = entry[1]
+        for i, (_, other) in enumerate(top):
+            if other == key:  # copies only grow, so the title can only move up
+                del top[i]
+                break
+        bisect.insort(top, entry)
+        del top[self.k:]
+
+    def complete(self, prefix, k=None):
+        """Up to k titles starting with `prefix` (case-insensitive)."""
+        prefix = prefix.casefold()
+        node, i = self._root, 0
+        while i < len(prefix):
+            node = node.children.get(prefix[i]) if node.children else None
+            if node is None:
+                return []
+            rest = prefix[i:i + len(node.label)]
+            if not node.label.startswith(rest):
+                return []
+            i += len(node.label)
+        return [self._display[key] for _, key in node.top[:k or self.k]]
+
+
+def edit_distance(a, b, limit):
+    """
+    Edit distance between a and b counting insertions, deletions,
+    substitutions and swaps of adjacent characters ("1948" -> "1984" is 1),
+    or limit + 1 as soon as it is certain to exceed `limit`.
+    Only the diagonal band |i - j| <= limit of the table is filled in,
+    so the cost is O(len(a) * limit) instead of O(len(a) * len(b)).
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    big = limit + 1
+    before, previous = None, [j if j <= limit else big for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        ca = a[i - 1]
+        lo, hi = max(1, i - limit), min(len(b), i + limit)
+        current = [big] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(lo, hi + 1):
+            cb = b[j - 1]
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current[j] = cost
+        if min(current[lo - 1:hi + 1]) > limit and min(previous) > limit:
+            return big
+        before, previous = previous, current
+    return min(previous[-1], big)
+
+
+class TrigramIndex:
+    """
+    Character trigram index for "did you mean" title lookup (Abstraction).
+
+    - Each distinct casefolded title is padded ("  1984 ") and cut into
+      3-character grams; every gram keeps a posting list of title ids.
+    - One edit changes at most 4 grams (3, or 4 for a swap), so a title
+      within distance d of the query shares at least len(query grams) - 4d
+      of them. Such a title must contain one of the (4d + 1) rarest query
+      grams, so candidates
+      are collected from those short posting lists only (prefix filtering).
+    - Candidates are then pruned by length and gram overlap, and edit
+      distance is computed only for the survivors, most similar first.
+    """
+
+    def __init__(self):
+        self._titles = []    # title id -> title as first added
+        self._keys = []      # title id -> casefolded title
+        self._ids = {}       # casefolded title -> title id
+        self._postings = {}  # gram -> array("I") of title ids (sorted)
+
+    @staticmethod
+    def grams(key):
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, title):
+        key = title.casefold()
+        if key in self._ids:
+            return
+        title_id = self._ids[key] = len(self._keys)
+        self._titles.append(title)
+        self._keys.append(key)
+        for gram in self.grams(key):
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array("I")
+            postings.append(title_id)
+
+    def lookup(self, query, k=5, max_distance=None):
+        """
+        Up to k titles within `max_distance` edits of `query`, closest first.
+        The default allows about one edit per four characters.
+        """
+        key = query.casefold()
+        grams = self.grams(key)
+        if max_distance is None:
+            max_distance = max(1, len(key) // 4)
+        # Keep the overlap bound positive, otherwise every title is a candidate
+        max_distance = min(max_distance, (len(grams) - 1) // 4)
+        if max_distance < 0:
+            return []
+        min_shared = len(grams) - 4 * max_distance
+        empty = array("I")
+        rarest = sorted(grams, key=lambda g: len(self._postings.get(g, empty)))
+        candidates = set()
+        for gram in rarest[:len(grams) - min_shared + 1]:
+            candidates.update(self._postings.get(gram, empty))
+        shortlist = []
+        for title_id in candidates:
+            other = self._keys[title_id]
+            if abs(len(other) - len(key)) > max_distance:
+                continue
+            shared = len(grams & self.grams(other))
+            if shared >= min_shared:
+                shortlist.append((-shared, title_id))
+        # Most similar first: once k matches are found, the k-th best
+        # distance becomes the limit for the rest of the shortlist
+        shortlist.sort()
+        ranked, limit = [], max_distance
+        for _, title_id in shortlist:
+            other = self._keys[title_id]
+            distance = edit_distance(key, other, limit)
+            if distance <= limit:
+                ranked.append((distance, other, title_id))
+                if len(ranked) >= k:
+                    ranked.sort()
+                    del ranked[k:]
+                    limit = ranked[-1][0]
+        ranked.sort()
+        return [self._titles[title_id] for _, _, title_id in ranked[:k]]
+
+
+def current_rss_mb():
+    """Resident memory of this process in MB (peak RSS where /proc is missing)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
 class Library:
     """Represents the library containing books (Class & Object Concept)"""
     def __init__(self):
         self.books = []  # Stores book objects
+        # Hash indexes (keys are casefold()'d once, when the book is added)
+        self._by_title = {}    # title key -> all copies of that title
+        self._available = {}   # title key -> copies on the shelf (stack)
+        self._borrowed = {}    # title key -> copies currently borrowed
+        self._by_author = {}   # author key -> books by that author
+        self.search_index = InvertedIndex()  # doc id = position in self.books
+        self.title_trie = TitleTrie(k=10)
+        self.fuzzy_index = TrigramIndex()
+        # Concurrency: one lock per stripe of titles (not one per book)
+        self._locks = [threading.Lock() for _ in range(64)]
+        self._catalog_lock = threading.Lock()  # add_book updates shared indexes
+        # Loans: due dates in a min-heap, reservations in per-title FIFO queues
+        self.loan_days = 14
+        self._reservations = {}  # title key -> deque of waiting patrons
+        self._due_heap = []      # (due, loan id, book); entries of returned loans are stale
+        self._overdue = {}       # loan id -> book, collected by sweep_overdue()
+        self._active_loans = 0
+        self._loan_ids = itertools.count(1)
+        self._loan_lock = threading.Lock()  # guards the heap and loan ids
 
     def add_book(self, book):
         """Add a book to the library (Method & Encapsulation)"""
-        self.books.append(book)
+        self._add(book)
         print(f"Book '{book.title}' added to library.")
 
+    def _add(self, book):
+        """File a book in every index, quietly"""
+        key = book.title.casefold()
+        with self._catalog_lock, self._lock_for(key):
+            self.books.append(book)
+            self._by_title.setdefault(key, []).append(book)
+            self._available.setdefault(key, [])
+            queue = self._reservations.get(key)
+            if not book.is_borrowed and queue:  # a new copy goes to the first reservation
+                self._start_loan(book, queue.popleft(), None)
+            if book.is_borrowed:  # the borrowed list is created on first use
+                self._borrowed.setdefault(key, []).append(book)
+            else:
+                self._available[key].append(book)
+            self._by_author.setdefault(book.author.casefold(), []).append(book)
+            self._index_book(len(self.books) - 1, book)
+            self.title_trie.add(book.title)
+            self.fuzzy_index.add(book.title)
+
+    def _index_book(self, doc_id, book):
+        """
+        Add a book to the keyword index. If a loaded index disagrees with
+        the catalog at this position (another catalog, or another order),
+        it is stale: drop it and rebuild from self.books.
+        """
+        text = f"{book.title} {book.author}"
+        if self.search_index.matches(doc_id, text):
+            return
+        if doc_id < self.search_index.doc_count:
+            self.search_index = InvertedIndex()
+            for earlier, other in enumerate(self.books[:doc_id]):
+                self.search_index.add(earlier, f"{other.title} {other.author}")
+        self.search_index.add(doc_id, text)
+
+    def load_catalog(self, path):
+        """
+        Stream a large catalog into the library without printing per book.
+        - CSV with columns title, author[, copies] or JSONL objects with the
+          same keys; rows are read one at a time.
+        - Author strings are interned and copies of a title share one title
+          string, so repeated values are stored once.
+        - A missing or empty copies value means 1 copy; "0" / 0 means none.
+        - Malformed rows (bad JSON, missing title or author, copies not a
+          whole number >= 0) are skipped and counted, not fatal.
+        Returns a report: books, titles, failed, seconds, books_per_sec, rss_mb.
+        """
+        start = time.perf_counter()
+        loaded = failed = 0
+        with open(path, newline="", encoding="utf-8") as f:
+            jsonl = path.endswith(".jsonl")
+            rows = (line for line in f if line.strip()) if jsonl else csv.DictReader(f)
+            for row in rows:
+                try:
+                    if jsonl:
+                        row = json.loads(row)
+                    title, author = row["title"], row["author"]
+                    copies = row.get("copies", 1)
+                    if isinstance(copies, float) and not copies.is_integer():
+                        raise ValueError("copies must be a whole number")
+                    copies = 1 if copies is None or copies == "" else int(copies)
+                    if not isinstance(title, str) or not isinstance(author, str) or copies < 0:
+                        raise ValueError("malformed row")
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    failed += 1
+                    continue
+                author = sys.intern(author)
+                existing = self._by_title.get(title.casefold())
+                if existing and existing[0].title == title:
+                    title = existing[0].title
+                for _ in range(copies):
+                    self._add(Book(title, author))
+                    loaded += 1
+        elapsed = time.perf_counter() - start
+        return {
+            "books": loaded,
+            "titles": len(self._by_title),
+            "failed": failed,
+            "seconds": round(elapsed, 3),
+            "books_per_sec": round(loaded / elapsed) if elapsed else loaded,
+            "rss_mb": round(current_rss_mb(), 1),
+        }
+
+    def search(self, query):
+        """
+        Keyword search over titles and authors, best match first.
+        Words are ANDed; "x or y" switches to OR.
+        """
+        words = query.split()
+        mode = "or" if any(w.casefold() == "or" for w in words) else "and"
+        if mode == "or":
+            query = " ".join(w for w in words if w.casefold() != "or")
+        # a loaded index may cover more documents than the catalog has so far
+        return [self.books[doc] for doc, _ in self.search_index.search(query, mode)
+                if doc < len(self.books)]
+
+    def autocomplete(self, prefix, k=10):
+        """Top-k titles starting with the typed prefix (most copies first)"""
+        return self.title_trie.complete(prefix, k)
+
+    def suggest(self, title, k=5):
+        """Titles close to a misspelled one (trigram shortlist + edit distance)"""
+        return self.fuzzy_index.lookup(title, k)
+
+    def save_search_index(self, path):
+        """Persist the keyword index (Encapsulation: format is internal)"""
+        self.search_index.save(path)
+
+    def load_search_index(self, path):
+        """
+        Load a saved keyword index. Call before re-adding the catalog:
+        books already covered by the index are not tokenized again, and
+        an index saved for a different catalog is rebuilt.
+        """
+        with self._catalog_lock:
+            self.search_index = InvertedIndex.load(path)
+            for doc_id, book in enumerate(self.books):
+                self._index_book(doc_id, book)
+
+    def find_by_title(self, title):
+        """All copies with this title, ignoring case (O(1) lookup)"""
+        return self._by_title.get(title.casefold(), [])
+
+    def find_by_author(self, author):
+        """All books by this author, ignoring case (O(1) lookup)"""
+        return self._by_author.get(author.casefold(), [])
+
     def show_books(self):
         """Display all books (Method & Abstraction)"""
         if not self.books:
@@ -84,31 +631,246 @@ class Library:
             print(f"{idx}. {book}")
         print()
 
-    def borrow_book(self, title):
+    def _lock_for(self, key):
+        """Striped lock that guards one title's copy lists"""
+        return self._locks[hash(key) % len(self._locks)]
+
+    def _start_loan(self, book, patron, now):
+        """Mark a copy borrowed and schedule its due date (caller holds the title lock)"""
+        book.is_borrowed = True
+        book.borrower = patron
+        book.due = (now or datetime.now()) + timedelta(days=self.loan_days)
+        with self._loan_lock:
+            book.loan = next(self._loan_ids)
+            heapq.heappush(self._due_heap, (book.due, book.loan, book))
+            self._active_loans += 1
+
+    def _end_loan(self, book):
+        """Close a copy's loan; its heap entry becomes stale (caller holds the title lock)"""
+        with self._loan_lock:
+            if book.loan is not None:  # books added as already borrowed have no loan
+                self._overdue.pop(book.loan, None)
+                book.loan = None
+                self._active_loans -= 1
+            heap = self._due_heap
+            if len(heap) > 2 * self._active_loans + 64:  # mostly stale: rebuild
+                heap[:] = [entry for entry in heap if entry[2].loan == entry[1]]
+                heapq.heapify(heap)
+        book.is_borrowed = False
+        book.borrower = None
+        book.due = None
+
+    def checkout(self, title, patron=None, now=None):
+        """
+        Thread-safe borrow of one copy. The title's stripe lock makes
+        the "is a copy free? take it" step atomic, so two terminals can
+        never get the same last copy. The loan is due loan_days after `now`.
+        Returns (status, book): status is "ok", "unavailable" or "missing".
+        """
+        key = title.casefold()
+        if key not in self._by_title:
+            return "missing", None
+        with self._lock_for(key):
+            shelf = self._available[key]
+            if not shelf:
+                return "unavailable", None
+            book = shelf.pop()
+            self._start_loan(book, patron, now)
+            self._borrowed.setdefault(key, []).append(book)
+        return "ok", book
+
+    def checkin(self, title, patron=None, now=None):
+        """
+        Thread-safe return of one copy (the patron's copy, if a patron is
+        given). If someone reserved the title the copy is loaned to them
+        straight away instead of going back on the shelf.
+        Returns (status, book): status is "ok", "reserved", "not_borrowed"
+        or "missing".
+        """
+        key = title.casefold()
+        if key not in self._by_title:
+            return "missing", None
+        with self._lock_for(key):
+            out = self._borrowed.get(key)
+            if not out:
+                return "not_borrowed", None
+            if patron is None:
+                book = out.pop()
+            else:
+                index = next((i for i, b in enumerate(out) if b.borrower == patron), None)
+                if index is None:
+                    return "not_borrowed", None
+                book = out.pop(index)
+            self._end_loan(book)
+            queue = self._reservations.get(key)
+            if queue:
+                self._start_loan(book, queue.popleft(), now)
+                out.append(book)
+                return "reserved", book
+            self._available[key].append(book)
+        return "ok", book
+
+    def reserve(self, title, patron):
+        """
+        Join the FIFO waiting list of a title that has no free copy.
+        Returns (status, position): status is "reserved" (position is the
+        place in the queue, 1 = next), "available" or "missing".
+        """
+        key = title.casefold()
+        if key not in self._by_title:
+            return "missing", None
+        with self._lock_for(key):
+            if self._available[key]:
+                return "available", None
+            queue = self._reservations.setdefault(key, deque())
+            queue.append(patron)
+            return "reserved", len(queue)
+
+    def sweep_overdue(self, now=None):
+        """
+        Hourly overdue check. Only heap entries whose due date has passed are
+        popped, so a sweep costs O(expired * log loans) however big the
+        catalog is. Stale entries (copy already returned) are dropped.
+        Returns the loans that became overdue since the previous sweep.
+        """
+        now = now or datetime.now()
+        newly_overdue = []
+        with self._loan_lock:
+            heap = self._due_heap
+            while heap and heap[0][0] < now:
+                _, loan, book = heapq.heappop(heap)
+                if book.loan == loan:
+                    self._overdue[loan] = book
+                    newly_overdue.append(book)
+        return newly_overdue
+
+    def overdue_books(self):
+        """All loans found overdue by the sweeps and not yet returned, oldest due first"""
+        with self._loan_lock:
+            return sorted(self._overdue.values(), key=lambda book: book.due)
+
+    def checkout_many(self, titles, patron=None, now=None):
+        """
+        Check out a whole cart atomically: either every title gets a copy
+        or nothing is borrowed. The stripe locks are taken in ascending
+        order, so overlapping carts cannot deadlock.
+        Returns the list of borrowed books, or None if any title was
+        missing or had no free copy.
+        """
+        keys = [t.casefold() for t in titles]
+        if any(key not in self._by_title for key in keys):
+            return None
+        needed = {}
+        for key in keys:
+            needed[key] = needed.get(key, 0) + 1
+        stripes = sorted({hash(key) % len(self._locks) for key in needed})
+        for stripe in stripes:
+            self._locks[stripe].acquire()
+        try:
+            if any(len(self._available[key]) < count for key, count in needed.items()):
+                return None
+            books = []
+            for key in keys:
+                book = self._available[key].pop()
+                self._start_loan(book, patron, now)
+                self._borrowed.setdefault(key, []).append(book)
+                books.append(book)
+            return books
+        finally:
+            for stripe in reversed(stripes):
+                self._locks[stripe].release()
+
+    def borrow_book(self, title, patron=None):
         """Borrow a book if available (Encapsulation & Method)"""
-        for book in self.books:
-            if book.title.lower() == title.lower():
-                if not book.is_borrowed:
-                    book.is_borrowed = True
-                    print(f"You have borrowed '{book.title}'. Enjoy reading!")
-                    return
-                else:
-                    print(f"Sorry, '{book.title}' is already borrowed.")
-                    return
-        print(f"Book '{title}' not found in the library.")
+        status, book = self.checkout(title, patron)
+        if status == "missing":
+            print(f"Book '{title}' not found in the library.")
+            suggestions = self.suggest(title)
+            if suggestions:
+                print("Did you mean: " + ", ".join(f"'{t}'" for t in suggestions) + "?")
+        elif status == "unavailable":
+            print(f"Sorry, '{self.find_by_title(title)[0].title}' is already borrowed. "
+                  "You can reserve it.")
+        else:
+            print(f"You have borrowed '{book.title}', due {book.due:%Y-%m-%d}. Enjoy reading!")
+
+    def reserve_book(self, title, patron):
+        """Reserve a borrowed-out title (Encapsulation & Method)"""
+        status, position = self.reserve(title, patron)
+        if status == "missing":
+            print(f"Book '{title}' not found in the library.")
+        elif status == "available":
+            print(f"'{self.find_by_title(title)[0].title}' is available, no need to reserve.")
+        else:
+            print(f"Reserved '{self.find_by_title(title)[0].title}' for {patron}. "
+                  f"Position in queue: {position}.")
 
     def return_book(self, title):
         """Return a borrowed book (Encapsulation & Method)"""
-        for book in self.books:
-            if book.title.lower() == title.lower():
-                if book.is_borrowed:
-                    book.is_borrowed = False
-                    print(f"Thank you for returning '{book.title}'.")
-                    return
-                else:
-                    print(f"'{book.title}' was not borrowed.")
-                    return
-        print(f"Book '{title}' not found in the library.")
+        status, book = self.checkin(title)
+        if status == "missing":
+            print(f"Book '{title}' not found in the library.")
+        elif status == "not_borrowed":
+            print(f"'{self.find_by_title(title)[0].title}' was not borrowed.")
+        elif status == "reserved":
+            print(f"Thank you for returning '{book.title}'. It is now loaned to "
+                  f"{book.borrower}, who reserved it.")
+        else:
+            print(f"Thank you for returning '{book.title}'.")
+
+
+def run_contention_benchmark(num_threads=16, ops_per_thread=5000, popular_titles=5,
+                             copies=3, seed=1):
+    """
+    Many terminals (threads) borrowing and returning the same few popular
+    titles. Checks afterwards that every copy is back on its shelf exactly
+    once, i.e. no copy was ever handed out twice.
+    """
+    library = Library()
+    titles = [f"Bestseller {i}" for i in range(popular_titles)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for title in titles:
+            for _ in range(copies):
+                library.add_book(Book(title, "Popular Author"))
+    borrowed = [0] * num_threads
+
+    def terminal(index):
+        rng = random.Random(seed + index)
+        for _ in range(ops_per_thread):
+            if rng.random() < 0.2:
+                cart = rng.sample(titles, 2)
+                books = library.checkout_many(cart)
+                if books:
+                    borrowed[index] += len(books)
+                    for book in books:
+                        library.checkin(book.title)
+            else:
+                title = rng.choice(titles)
+                status, _ = library.checkout(title)
+                if status == "ok":
+                    borrowed[index] += 1
+                    library.checkin(title)
+
+    threads = [threading.Thread(target=terminal, args=(i,)) for i in range(num_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    consistent = all(
+        len(library._available[t.casefold()]) == copies
+        and len({id(b) for b in library._available[t.casefold()]}) == copies
+        and not library._borrowed.get(t.casefold())
+        for t in titles)
+    return {
+        "terminals": num_threads,
+        "requests": num_threads * ops_per_thread,
+        "copies_borrowed": sum(borrowed),
+        "requests_per_sec": round(num_threads * ops_per_thread / elapsed),
+        "consistent": consistent,
+    }
 
 
 # ------------------------
@@ -122,6 +884,7 @@ def main():
     library.add_book(Book("The Alchemist", "Paulo Coelho"))
     library.add_book(Book("1984", "George Orwell"))
     library.add_book(Book("Python Programming", "John Zelle"))
+    library.add_book(Book("1984", "George Orwell"))  # a second copy
 
     while True:
         print("\n=== Library Menu ===")
@@ -130,14 +893,19 @@ def main():
         print("3. Return a book")
         print("4. Add a book")
         print("5. Exit")
+        print("6. Search books")
+        print("7. Autocomplete a title")
+        print("8. Reserve a book")
+        print("9. Show overdue loans")
 
-        choice = input("Enter your choice (1-5): ")
+        choice = input("Enter your choice (1-9): ")
 
         if choice == "1":
             library.show_books()
         elif choice == "2":
             title = input("Enter the title of the book to borrow: ")
-            library.borrow_book(title)
+            patron = input("Enter your name: ")
+            library.borrow_book(title, patron)
         elif choice == "3":
             title = input("Enter the title of the book to return: ")
             library.return_book(title)
@@ -148,9 +916,39 @@ def main():
         elif choice == "5":
             print("Exiting the library system. Goodbye!")
             break
+        elif choice == "6":
+            query = input("Enter keywords (use 'or' for any word): ")
+            results = library.search(query)
+            if not results:
+                print("No matching books.")
+            for idx, book in enumerate(results, start=1):
+                print(f"{idx}. {book}")
+        elif choice == "7":
+            prefix = input("Start typing a title: ")
+            print("Suggestions:", ", ".join(library.autocomplete(prefix)) or "none")
+        elif choice == "8":
+            title = input("Enter the title of the book to reserve: ")
+            patron = input("Enter your name: ")
+            library.reserve_book(title, patron)
+        elif choice == "9":
+            library.sweep_overdue()
+            overdue = library.overdue_books()
+            if not overdue:
+                print("No overdue loans.")
+            for book in overdue:
+                print(f"{book.title} - borrowed by {book.borrower}, due {book.due:%Y-%m-%d}")
         else:
-            print("Invalid choice. Please enter a number between 1-5.")
+            print("Invalid choice. Please enter a number between 1-9.")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Library System")
+    parser.add_argument("--benchmark", action="store_true", help="run the checkout contention benchmark")
+    parser.add_argument("--load", metavar="CATALOG", help="stream a CSV/JSONL catalog and report load rate and RSS")
+    args = parser.parse_args()
+    if args.benchmark:
+        print(run_contention_benchmark())
+    elif args.load:
+        print(Library().load_catalog(args.load))
+    else:
+        main()
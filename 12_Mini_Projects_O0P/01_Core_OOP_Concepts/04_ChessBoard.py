@@ -136,6 +136,12 @@ if __name__ == "__main__":
     system.confirm_booking(selected2, CardPayment())
 
 
+import argparse
+import random
+import sys
+import time
+
+
 # Base Class
 class ChessPiece:
     def __init__(self, name, color, position):
@@ -220,9 +226,10 @@ class King(ChessPiece):
 
 # ChessBoard Class
 class ChessBoard:
-    def __init__(self):
+    def __init__(self, setup=True):
         self.board = [[None for _ in range(8)] for _ in range(8)]
-        self.setup_pieces()
+        if setup:
+            self.setup_pieces()
 
     def setup_pieces(self):
         # Place a few pieces (simplified setup)
@@ -250,9 +257,1019 @@ class ChessBoard:
             print([str(piece) if piece else "--" for piece in row])
         print("\n")
 
+    def to_bitboard(self):
+        """Engine representation of this board (see BitBoard)."""
+        return BitBoard.from_board(self)
+
+
+# ---------- Bitboards ----------
+# Engine representation of the same board: one 64-bit integer per color and
+# piece type, where bit (row * 8 + col) is set if such a piece stands on
+# board[row][col]. Row 0 is Black's back rank, as in ChessBoard.
+# Attack queries become a few integer AND / OR operations on precomputed
+# tables instead of loops over nested lists.
+
+WHITE, BLACK = 0, 1
+COLORS = ("White", "Black")
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+PIECE_CLASSES = (Pawn, Knight, Bishop, Rook, Queen, King)
+
+# (row step, col step). The first four increase the square index, so the
+# nearest blocker on them is the lowest set bit; the last four the highest.
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1), (-1, -1), (-1, 1))
+ROOK_DIRECTIONS = (0, 1, 4, 5)
+BISHOP_DIRECTIONS = (2, 3, 6, 7)
+
+
+def square(row, col):
+    return row * 8 + col
+
+
+def squares_of(bb):
+    """Yield the square index of every set bit, lowest first."""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+def _step_targets(sq, steps):
+    row, col = divmod(sq, 8)
+    bb = 0
+    for dr, dc in steps:
+        r, c = row + dr, col + dc
+        if 0 <= r < 8 and 0 <= c < 8:
+            bb |= 1 << square(r, c)
+    return bb
+
+
+def _ray(sq, direction):
+    dr, dc = DIRECTIONS[direction]
+    row, col = divmod(sq, 8)
+    bb = 0
+    row, col = row + dr, col + dc
+    while 0 <= row < 8 and 0 <= col < 8:
+        bb |= 1 << square(row, col)
+        row, col = row + dr, col + dc
+    return bb
+
+
+# Precomputed attack tables (built once at import)
+KNIGHT_ATTACKS = [_step_targets(sq, ((1, 2), (2, 1), (2, -1), (1, -2),
+                                     (-1, -2), (-2, -1), (-2, 1), (-1, 2))) for sq in range(64)]
+KING_ATTACKS = [_step_targets(sq, DIRECTIONS) for sq in range(64)]
+# White pawns move towards row 0, Black pawns towards row 7
+PAWN_ATTACKS = ([_step_targets(sq, ((-1, -1), (-1, 1))) for sq in range(64)],
+                [_step_targets(sq, ((1, -1), (1, 1))) for sq in range(64)])
+RAYS = [[_ray(sq, direction) for sq in range(64)] for direction in range(8)]
+FULL = (1 << 64) - 1
+ROWS = [0xFF << (8 * row) for row in range(8)]
+FILE_A = sum(1 << square(row, 0) for row in range(8))
+FILE_H = FILE_A << 7
+
+
+def _between_table():
+    """BETWEEN[a][b]: squares strictly between two aligned squares, else 0."""
+    table = [[0] * 64 for _ in range(64)]
+    for direction in range(8):
+        for a in range(64):
+            for b in squares_of(RAYS[direction][a]):
+                table[a][b] = RAYS[direction][a] & ~RAYS[direction][b] & ~(1 << b)
+    return table
+
+
+BETWEEN = _between_table()
+
+
+def slider_attacks(sq, occupied, directions):
+    """Squares attacked along `directions`, stopping at the first blocker."""
+    attacks = 0
+    for direction in directions:
+        ray = RAYS[direction][sq]
+        blockers = ray & occupied
+        if blockers:
+            if direction < 4:
+                first = (blockers & -blockers).bit_length() - 1
+            else:
+                first = blockers.bit_length() - 1
+            ray ^= RAYS[direction][first]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq, occupied):
+    return slider_attacks(sq, occupied, ROOK_DIRECTIONS)
+
+
+def bishop_attacks(sq, occupied):
+    return slider_attacks(sq, occupied, BISHOP_DIRECTIONS)
+
+
+class BitBoard:
+    """
+    Bitboard position (Abstraction).
+
+    - pieces[color][piece_type] is a 64-bit int; occupancy[color] is the
+      union per color. squares[sq] mirrors them as (color, piece_type) or
+      None, so "what stands here?" stays an O(1) lookup.
+    - from_board() / to_board() convert from / to the ChessBoard object
+      board, which is still used for display.
+    """
+
+    def __init__(self):
+        self.pieces = [[0] * 6, [0] * 6]
+        self.occupancy = [0, 0]
+        self.squares = [None] * 64
+
+    @property
+    def occupied(self):
+        return self.occupancy[WHITE] | self.occupancy[BLACK]
+
+    def put(self, color, piece_type, sq):
+        mask = 1 << sq
+        self.pieces[color][piece_type] |= mask
+        self.occupancy[color] |= mask
+        self.squares[sq] = (color, piece_type)
+
+    def remove(self, sq):
+        """Take the piece off `sq` and return it as (color, piece_type)."""
+        piece = self.squares[sq]
+        if piece is not None:
+            color, piece_type = piece
+            mask = ~(1 << sq)
+            self.pieces[color][piece_type] &= mask
+            self.occupancy[color] &= mask
+            self.squares[sq] = None
+        return piece
+
+    def piece_at(self, sq):
+        return self.squares[sq]
+
+    @classmethod
+    def from_board(cls, chess_board):
+        bitboard = cls()
+        for row in range(8):
+            for col in range(8):
+                piece = chess_board.board[row][col]
+                if piece is not None:
+                    bitboard.put(COLORS.index(piece.color),
+                                 PIECE_CLASSES.index(type(piece)), square(row, col))
+        return bitboard
+
+    def to_board(self):
+        chess_board = ChessBoard(setup=False)
+        for sq, piece in enumerate(self.squares):
+            if piece is not None:
+                color, piece_type = piece
+                row, col = divmod(sq, 8)
+                piece_class = PIECE_CLASSES[piece_type]
+                chess_board.board[row][col] = piece_class(piece_class.__name__, COLORS[color], (row, col))
+        return chess_board
+
+    def attacks_from(self, sq):
+        """Squares the piece on `sq` attacks (own pieces included)."""
+        color, piece_type = self.squares[sq]
+        if piece_type == PAWN:
+            return PAWN_ATTACKS[color][sq]
+        if piece_type == KNIGHT:
+            return KNIGHT_ATTACKS[sq]
+        if piece_type == KING:
+            return KING_ATTACKS[sq]
+        occupied = self.occupied
+        if piece_type == BISHOP:
+            return bishop_attacks(sq, occupied)
+        if piece_type == ROOK:
+            return rook_attacks(sq, occupied)
+        return bishop_attacks(sq, occupied) | rook_attacks(sq, occupied)
+
+    def attackers_of(self, sq, color):
+        """Bitboard of `color` pieces attacking `sq`."""
+        pieces = self.pieces[color]
+        occupied = self.occupied
+        diagonal = pieces[BISHOP] | pieces[QUEEN]
+        straight = pieces[ROOK] | pieces[QUEEN]
+        return ((PAWN_ATTACKS[1 - color][sq] & pieces[PAWN])
+                | (KNIGHT_ATTACKS[sq] & pieces[KNIGHT])
+                | (KING_ATTACKS[sq] & pieces[KING])
+                | (bishop_attacks(sq, occupied) & diagonal if diagonal else 0)
+                | (rook_attacks(sq, occupied) & straight if straight else 0))
+
+    def is_attacked(self, sq, by_color):
+        return self.attackers_of(sq, by_color) != 0
+
+    def attacked_squares(self, color):
+        """Union of every square `color` attacks."""
+        attacks = 0
+        for sq in squares_of(self.occupancy[color]):
+            attacks |= self.attacks_from(sq)
+        return attacks
+
+    def display(self):
+        self.to_board().display()
+
+
+# ---------- Legal Move Generation ----------
+# A move is one int: from square | to square << 6 | promotion piece << 12
+# | flag << 15. Position adds the game state (side to move, castling rights,
+# en passant square, move clocks) and make() / unmake() a move in place.
+
+NORMAL, DOUBLE_PUSH, EN_PASSANT, CASTLE = range(4)
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+PIECE_LETTERS = "pnbrqk"
+FILES = "abcdefgh"
+
+# Castling rights bits and the squares involved (row 7 is White's back rank)
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+CASTLING_LETTERS = {"K": WHITE_KINGSIDE, "Q": WHITE_QUEENSIDE, "k": BLACK_KINGSIDE, "q": BLACK_QUEENSIDE}
+# king destination -> (rook from, rook to)
+CASTLE_ROOKS = {62: (63, 61), 58: (56, 59), 6: (7, 5), 2: (0, 3)}
+# rights that survive a move touching the square
+CASTLE_MASK = [15] * 64
+CASTLE_MASK[60] &= ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLE_MASK[63] &= ~WHITE_KINGSIDE
+CASTLE_MASK[56] &= ~WHITE_QUEENSIDE
+CASTLE_MASK[4] &= ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLE_MASK[7] &= ~BLACK_KINGSIDE
+CASTLE_MASK[0] &= ~BLACK_QUEENSIDE
+
+
+def square_name(sq):
+    row, col = divmod(sq, 8)
+    return f"{FILES[col]}{8 - row}"
+
+
+def parse_square(name):
+    return square(8 - int(name[1]), FILES.index(name[0]))
+
+
+def move_name(move):
+    """Coordinate notation, e.g. "e2e4" or "e7e8q"."""
+    promotion = (move >> 12) & 7
+    text = square_name(move & 63) + square_name((move >> 6) & 63)
+    return text + PIECE_LETTERS[promotion] if promotion else text
+
+
+# Zobrist keys: a position's hash is the XOR of one random 64-bit key per
+# (color, piece, square), plus keys for side to move, castling rights and the
+# en passant square. make() / unmake() update it with a few XORs.
+_zobrist_random = random.Random(2024)
+ZOBRIST_PIECES = [[[_zobrist_random.getrandbits(64) for _ in range(64)] for _ in range(6)]
+                  for _ in range(2)]
+ZOBRIST_SIDE = _zobrist_random.getrandbits(64)
+ZOBRIST_CASTLING = [_zobrist_random.getrandbits(64) for _ in range(16)]
+ZOBRIST_EP = [_zobrist_random.getrandbits(64) for _ in range(64)]
+
+
+class Position(BitBoard):
+    """
+    A BitBoard plus game state, with a legal move generator (Abstraction).
+
+    - generate_moves() returns only legal moves: the king never steps onto
+      an attacked square, pinned pieces stay on their pin line, in check
+      only captures of the checker or blocks are allowed, and castling
+      checks empty and unattacked squares. En passant is verified by
+      removing both pawns and testing the king (the rare discovered check).
+    - make(move) / unmake() update the bitboards in place and keep an undo
+      stack, so a search never copies positions.
+    - hash is the Zobrist key of the position, kept up to date by make().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.side = WHITE
+        self.castling = 0
+        self.ep_square = None
+        self.halfmove = 0
+        self.fullmove = 1
+        self.history = []  # undo records: (move, captured, castling, ep square, halfmove, hash)
+        self.hash = 0
+
+    @classmethod
+    def from_fen(cls, fen=START_FEN):
+        fields = fen.split()
+        position = cls()
+        sq = 0
+        for ch in fields[0]:
+            if ch == "/":
+                continue
+            if ch.isdigit():
+                sq += int(ch)
+            else:
+                position.put(WHITE if ch.isupper() else BLACK, PIECE_LETTERS.index(ch.lower()), sq)
+                sq += 1
+        position.side = WHITE if fields[1] == "w" else BLACK
+        for ch in fields[2]:
+            position.castling |= CASTLING_LETTERS.get(ch, 0)
+        position.ep_square = None if fields[3] == "-" else parse_square(fields[3])
+        if len(fields) > 5:
+            position.halfmove, position.fullmove = int(fields[4]), int(fields[5])
+        position.hash = position.compute_hash()
+        return position
+
+    @classmethod
+    def from_board(cls, chess_board, side=WHITE):
+        """Position of a ChessBoard object board (no castling or en passant rights)."""
+        position = super().from_board(chess_board)
+        position.side = side
+        position.hash = position.compute_hash()
+        return position
+
+    def compute_hash(self):
+        """Zobrist hash from scratch (make() updates it incrementally)."""
+        h = ZOBRIST_CASTLING[self.castling]
+        if self.side == BLACK:
+            h ^= ZOBRIST_SIDE
+        if self.ep_square is not None:
+            h ^= ZOBRIST_EP[self.ep_square]
+        for sq, piece in enumerate(self.squares):
+            if piece is not None:
+                h ^= ZOBRIST_PIECES[piece[0]][piece[1]][sq]
+        return h
+
+    def fen(self):
+        rows = []
+        for row in range(8):
+            text, empty = "", 0
+            for col in range(8):
+                piece = self.squares[square(row, col)]
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    text, empty = text + str(empty), 0
+                letter = PIECE_LETTERS[piece[1]]
+                text += letter.upper() if piece[0] == WHITE else letter
+            rows.append(text + (str(empty) if empty else ""))
+        castling = "".join(ch for ch, bit in CASTLING_LETTERS.items() if self.castling & bit) or "-"
+        ep = "-" if self.ep_square is None else square_name(self.ep_square)
+        return (f"{'/'.join(rows)} {'wb'[self.side]} {castling} {ep} "
+                f"{self.halfmove} {self.fullmove}")
+
+    def _attackers(self, sq, color, occupied):
+        """`color` pieces attacking `sq` if the board had this occupancy."""
+        pieces = self.pieces[color]
+        diagonal = pieces[BISHOP] | pieces[QUEEN]
+        straight = pieces[ROOK] | pieces[QUEEN]
+        attackers = ((PAWN_ATTACKS[1 - color][sq] & pieces[PAWN])
+                     | (KNIGHT_ATTACKS[sq] & pieces[KNIGHT])
+                     | (KING_ATTACKS[sq] & pieces[KING]))
+        if diagonal:
+            attackers |= bishop_attacks(sq, occupied) & diagonal
+        if straight:
+            attackers |= rook_attacks(sq, occupied) & straight
+        return attackers & occupied
+
+    def king_square(self, color):
+        return self.pieces[color][KING].bit_length() - 1
+
+    def in_check(self):
+        us = self.side
+        return self._attackers(self.king_square(us), 1 - us, self.occupied) != 0
+
+    def generate_moves(self):
+        """All legal moves for the side to move."""
+        us, them = self.side, 1 - self.side
+        own, enemy = self.occupancy[us], self.occupancy[them]
+        occupied = own | enemy
+        mine, theirs = self.pieces[us], self.pieces[them]
+        king_sq = mine[KING].bit_length() - 1
+        attackers = self._attackers
+        moves = []
+        append = moves.append
+
+        # King: the king itself is lifted so sliders see through its square
+        without_king = occupied ^ (1 << king_sq)
+        for to in squares_of(KING_ATTACKS[king_sq] & ~own):
+            if not attackers(to, them, without_king):
+                append(king_sq | to << 6)
+        checkers = attackers(king_sq, them, occupied)
+        if checkers & (checkers - 1):
+            return moves  # double check: only the king can move
+
+        if checkers:
+            checker = checkers.bit_length() - 1
+            targets = (checkers | BETWEEN[king_sq][checker]) & ~own
+        else:
+            targets = ~own & FULL
+            self._castling_moves(us, them, occupied, append)
+
+        # Pins: an enemy slider behind exactly one own piece on the king's line
+        pins = {}
+        snipers = ((rook_attacks(king_sq, enemy) & (theirs[ROOK] | theirs[QUEEN]))
+                   | (bishop_attacks(king_sq, enemy) & (theirs[BISHOP] | theirs[QUEEN])))
+        for sniper in squares_of(snipers):
+            line = BETWEEN[king_sq][sniper]
+            blockers = line & occupied
+            if blockers and not blockers & (blockers - 1) and blockers & own:
+                pins[blockers.bit_length() - 1] = line | (1 << sniper)
+
+        for sq in squares_of(mine[KNIGHT]):
+            if sq not in pins:
+                for to in squares_of(KNIGHT_ATTACKS[sq] & targets):
+                    append(sq | to << 6)
+        for piece_type, directions in ((BISHOP, BISHOP_DIRECTIONS), (ROOK, ROOK_DIRECTIONS),
+                                       (QUEEN, range(8))):
+            for sq in squares_of(mine[piece_type]):
+                allowed = targets & pins.get(sq, FULL)
+                for to in squares_of(slider_attacks(sq, occupied, directions) & allowed):
+                    append(sq | to << 6)
+
+        self._pawn_moves(us, them, mine[PAWN], enemy, occupied, targets, pins, king_sq, append)
+        return moves
+
+    def _castling_moves(self, us, them, occupied, append):
+        rights = self.castling
+        attackers = self._attackers
+        if us == WHITE:
+            if (rights & WHITE_KINGSIDE and not occupied & 0x6000000000000000
+                    and not attackers(61, them, occupied) and not attackers(62, them, occupied)):
+                append(60 | 62 << 6 | CASTLE << 15)
+            if (rights & WHITE_QUEENSIDE and not occupied & 0x0E00000000000000
+                    and not attackers(59, them, occupied) and not attackers(58, them, occupied)):
+                append(60 | 58 << 6 | CASTLE << 15)
+        else:
+            if (rights & BLACK_KINGSIDE and not occupied & 0x60
+                    and not attackers(5, them, occupied) and not attackers(6, them, occupied)):
+                append(4 | 6 << 6 | CASTLE << 15)
+            if (rights & BLACK_QUEENSIDE and not occupied & 0x0E
+                    and not attackers(3, them, occupied) and not attackers(2, them, occupied)):
+                append(4 | 2 << 6 | CASTLE << 15)
+
+    def _pawn_moves(self, us, them, pawns, enemy, occupied, targets, pins, king_sq, append):
+        empty = ~occupied & FULL
+        if us == WHITE:  # towards row 0: from = to + 8
+            single = (pawns >> 8) & empty
+            double = ((single & ROWS[5]) >> 8) & empty
+            groups = ((single, 8, NORMAL), (double, 16, DOUBLE_PUSH),
+                      (((pawns & ~FILE_A) >> 9) & enemy, 9, NORMAL),
+                      (((pawns & ~FILE_H) >> 7) & enemy, 7, NORMAL))
+            last_row = ROWS[0]
+        else:  # towards row 7: from = to - 8
+            single = (pawns << 8) & empty
+            double = ((single & ROWS[2]) << 8) & empty
+            groups = ((single, -8, NORMAL), (double, -16, DOUBLE_PUSH),
+                      (((pawns & ~FILE_A) << 7) & enemy, -7, NORMAL),
+                      (((pawns & ~FILE_H) << 9) & enemy, -9, NORMAL))
+            last_row = ROWS[7]
+        for bb, offset, flag in groups:
+            for to in squares_of(bb & targets):
+                frm = to + offset
+                if frm in pins and not pins[frm] >> to & 1:
+                    continue
+                if (1 << to) & last_row:
+                    for promotion in (QUEEN, ROOK, BISHOP, KNIGHT):
+                        append(frm | to << 6 | promotion << 12)
+                else:
+                    append(frm | to << 6 | flag << 15)
+
+        ep = self.ep_square
+        if ep is not None:
+            captured = ep + 8 if us == WHITE else ep - 8
+            for frm in squares_of(PAWN_ATTACKS[them][ep] & pawns):
+                after = occupied ^ (1 << frm) ^ (1 << captured) | (1 << ep)
+                if not self._attackers(king_sq, them, after):
+                    append(frm | ep << 6 | EN_PASSANT << 15)
+
+    def make(self, move):
+        frm, to = move & 63, (move >> 6) & 63
+        promotion, flag = (move >> 12) & 7, move >> 15
+        us = self.side
+        piece_type = self.squares[frm][1]
+        keys = ZOBRIST_PIECES
+        h = self.hash ^ ZOBRIST_SIDE ^ ZOBRIST_CASTLING[self.castling]
+        if self.ep_square is not None:
+            h ^= ZOBRIST_EP[self.ep_square]
+        captured_sq = to
+        if flag == EN_PASSANT:
+            captured_sq = to + 8 if us == WHITE else to - 8
+        captured = self.remove(captured_sq)
+        if captured is not None:
+            h ^= keys[captured[0]][captured[1]][captured_sq]
+        self.history.append((move, captured, self.castling, self.ep_square, self.halfmove, self.hash))
+        self.remove(frm)
+        self.put(us, promotion or piece_type, to)
+        h ^= keys[us][piece_type][frm] ^ keys[us][promotion or piece_type][to]
+        if flag == CASTLE:
+            rook_from, rook_to = CASTLE_ROOKS[to]
+            self.remove(rook_from)
+            self.put(us, ROOK, rook_to)
+            h ^= keys[us][ROOK][rook_from] ^ keys[us][ROOK][rook_to]
+        self.castling &= CASTLE_MASK[frm] & CASTLE_MASK[to]
+        h ^= ZOBRIST_CASTLING[self.castling]
+        self.ep_square = (frm + to) // 2 if flag == DOUBLE_PUSH else None
+        if self.ep_square is not None:
+            h ^= ZOBRIST_EP[self.ep_square]
+        self.hash = h
+        self.halfmove = 0 if piece_type == PAWN or captured else self.halfmove + 1
+        if us == BLACK:
+            self.fullmove += 1
+        self.side = 1 - us
+
+    def unmake(self):
+        move, captured, self.castling, self.ep_square, self.halfmove, self.hash = self.history.pop()
+        frm, to = move & 63, (move >> 6) & 63
+        promotion, flag = (move >> 12) & 7, move >> 15
+        us = self.side = 1 - self.side
+        if us == BLACK:
+            self.fullmove -= 1
+        piece_type = self.remove(to)[1]
+        self.put(us, PAWN if promotion else piece_type, frm)
+        if flag == CASTLE:
+            rook_from, rook_to = CASTLE_ROOKS[to]
+            self.remove(rook_to)
+            self.put(us, ROOK, rook_from)
+        if captured is not None:
+            if flag == EN_PASSANT:
+                self.put(captured[0], captured[1], to + 8 if us == WHITE else to - 8)
+            else:
+                self.put(captured[0], captured[1], to)
+
+    def parse_move(self, text):
+        """The legal move written as "e2e4" / "e7e8q", or None."""
+        for move in self.generate_moves():
+            if move_name(move) == text:
+                return move
+        return None
+
+    def perft(self, depth):
+        """Number of leaf nodes of the legal move tree `depth` plies deep."""
+        if depth == 0:
+            return 1
+        moves = self.generate_moves()
+        if depth == 1:
+            return len(moves)
+        nodes = 0
+        for move in moves:
+            self.make(move)
+            nodes += self.perft(depth - 1)
+            self.unmake()
+        return nodes
+
+
+# Standard perft positions with their published node counts per depth
+PERFT_POSITIONS = {
+    "start": (START_FEN, [20, 400, 8902, 197281, 4865609]),
+    "kiwipete": ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                 [48, 2039, 97862, 4085603]),
+    "position3": ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+                  [14, 191, 2812, 43238, 674624]),
+    "position4": ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                  [6, 264, 9467, 422333]),
+    "position5": ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                  [44, 1486, 62379, 2103487]),
+    "position6": ("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+                  [46, 2079, 89890, 3894594]),
+}
+
+
+def run_perft_benchmark(depth=3, positions=None):
+    """
+    Run perft on the standard positions, check the node counts against the
+    published ones and report the speed. Returns one result dict per position.
+    """
+    results = []
+    for name in positions or PERFT_POSITIONS:
+        fen, expected = PERFT_POSITIONS[name]
+        d = min(depth, len(expected))
+        position = Position.from_fen(fen)
+        start = time.perf_counter()
+        nodes = position.perft(d)
+        elapsed = time.perf_counter() - start
+        results.append({
+            "position": name,
+            "depth": d,
+            "nodes": nodes,
+            "expected": expected[d - 1],
+            "ok": nodes == expected[d - 1] and position.fen() == Position.from_fen(fen).fen(),
+            "nodes_per_sec": round(nodes / elapsed) if elapsed else nodes,
+        })
+    return results
+
+
+# ---------- Search Engine ----------
+# Iterative-deepening alpha-beta over Position, with a bounded Zobrist
+# transposition table and killer / history move ordering.
+
+MATE = 100000
+INFINITY = 10 ** 6
+MAX_PLY = 64
+EXACT, LOWER, UPPER = range(3)  # transposition table bound types
+PIECE_VALUES = (100, 320, 330, 500, 900, 0)
+
+# Piece-square tables from White's point of view, row 0 (rank 8) first.
+# Black uses the same table mirrored vertically (square ^ 56).
+_PIECE_SQUARE_TABLES = (
+    (0, 0, 0, 0, 0, 0, 0, 0,
+     50, 50, 50, 50, 50, 50, 50, 50,
+     10, 10, 20, 30, 30, 20, 10, 10,
+     5, 5, 10, 25, 25, 10, 5, 5,
+     0, 0, 0, 20, 20, 0, 0, 0,
+     5, -5, -10, 0, 0, -10, -5, 5,
+     5, 10, 10, -20, -20, 10, 10, 5,
+     0, 0, 0, 0, 0, 0, 0, 0),
+    (-50, -40, -30, -30, -30, -30, -40, -50,
+     -40, -20, 0, 0, 0, 0, -20, -40,
+     -30, 0, 10, 15, 15, 10, 0, -30,
+     -30, 5, 15, 20, 20, 15, 5, -30,
+     -30, 0, 15, 20, 20, 15, 0, -30,
+     -30, 5, 10, 15, 15, 10, 5, -30,
+     -40, -20, 0, 5, 5, 0, -20, -40,
+     -50, -40, -30, -30, -30, -30, -40, -50),
+    (-20, -10, -10, -10, -10, -10, -10, -20,
+     -10, 0, 0, 0, 0, 0, 0, -10,
+     -10, 0, 5, 10, 10, 5, 0, -10,
+     -10, 5, 5, 10, 10, 5, 5, -10,
+     -10, 0, 10, 10, 10, 10, 0, -10,
+     -10, 10, 10, 10, 10, 10, 10, -10,
+     -10, 5, 0, 0, 0, 0, 5, -10,
+     -20, -10, -10, -10, -10, -10, -10, -20),
+    (0, 0, 0, 0, 0, 0, 0, 0,
+     5, 10, 10, 10, 10, 10, 10, 5,
+     -5, 0, 0, 0, 0, 0, 0, -5,
+     -5, 0, 0, 0, 0, 0, 0, -5,
+     -5, 0, 0, 0, 0, 0, 0, -5,
+     -5, 0, 0, 0, 0, 0, 0, -5,
+     -5, 0, 0, 0, 0, 0, 0, -5,
+     0, 0, 0, 5, 5, 0, 0, 0),
+    (-20, -10, -10, -5, -5, -10, -10, -20,
+     -10, 0, 0, 0, 0, 0, 0, -10,
+     -10, 0, 5, 5, 5, 5, 0, -10,
+     -5, 0, 5, 5, 5, 5, 0, -5,
+     0, 0, 5, 5, 5, 5, 0, -5,
+     -10, 5, 5, 5, 5, 5, 0, -10,
+     -10, 0, 5, 0, 0, 0, 0, -10,
+     -20, -10, -10, -5, -5, -10, -10, -20),
+    (-30, -40, -40, -50, -50, -40, -40, -30,
+     -30, -40, -40, -50, -50, -40, -40, -30,
+     -30, -40, -40, -50, -50, -40, -40, -30,
+     -30, -40, -40, -50, -50, -40, -40, -30,
+     -20, -30, -30, -40, -40, -30, -30, -20,
+     -10, -20, -20, -20, -20, -20, -20, -10,
+     20, 20, 0, 0, 0, 0, 20, 20,
+     20, 30, 10, 0, 0, 10, 30, 20),
+)
+# PIECE_SQUARE[color][piece_type][sq]: material + position bonus for that color
+PIECE_SQUARE = [[[PIECE_VALUES[piece_type] + _PIECE_SQUARE_TABLES[piece_type][sq ^ (56 * color)]
+                  for sq in range(64)] for piece_type in range(6)] for color in range(2)]
+
+
+def evaluate(position):
+    """Material and piece-square score, from the side to move's point of view."""
+    score = 0
+    for color, sign in ((WHITE, 1), (BLACK, -1)):
+        tables, pieces = PIECE_SQUARE[color], position.pieces[color]
+        for piece_type in range(6):
+            table, bb = tables[piece_type], pieces[piece_type]
+            while bb:  # squares_of() inlined: this runs at every leaf
+                low = bb & -bb
+                score += sign * table[low.bit_length() - 1]
+                bb ^= low
+    return score if position.side == WHITE else -score
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget is used up."""
+
+
+class TranspositionTable:
+    """
+    Fixed-size cache of search results keyed by Zobrist hash (Abstraction).
+
+    - Memory is bounded: size_mb fixes the number of buckets up front (a
+      power of two, so a bucket is hash & mask) and the table never grows.
+    - Each bucket has two slots. The first is depth-preferred: it is only
+      replaced by an equal or deeper result, or by anything once its entry
+      is left over from an earlier search. The second always takes the
+      newest result, so shallow recent positions are cached too.
+    """
+
+    ENTRY_BYTES = 200  # rough CPython size of one stored entry
+
+    def __init__(self, size_mb=16):
+        buckets = 1
+        while 2 * (buckets * 2) * self.ENTRY_BYTES <= size_mb * 2 ** 20:
+            buckets *= 2
+        self.mask = buckets - 1
+        self.slots = [None] * (2 * buckets)  # (key, depth, bound, score, move, age)
+        self.age = 0
+
+    def new_search(self):
+        self.age += 1
+
+    def probe(self, key):
+        i = (key & self.mask) << 1
+        entry = self.slots[i]
+        if entry is not None and entry[0] == key:
+            return entry
+        entry = self.slots[i + 1]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, bound, score, move):
+        i = (key & self.mask) << 1
+        first = self.slots[i]
+        entry = (key, depth, bound, score, move, self.age)
+        if first is None or first[0] == key or first[5] != self.age or depth >= first[1]:
+            self.slots[i] = entry
+        else:
+            self.slots[i + 1] = entry
+
+
+class SearchEngine:
+    """
+    Iterative-deepening alpha-beta search (Abstraction).
+
+    - Each iteration searches one ply deeper; the transposition table
+      carries the best moves of the previous iteration, so they are tried
+      first and most of the tree is cut off early.
+    - Move order: table move, captures (most valuable victim, least
+      valuable attacker), promotions, two killer moves per ply (quiet
+      moves that caused a cutoff at that ply) and then the history score
+      (how often a from/to pair caused a cutoff, weighted by depth).
+    - Leaves are resolved with a captures-only quiescence search.
+    - The clock is checked every 1024 nodes; when time is up the current
+      iteration is abandoned and the last complete result is returned.
+    """
+
+    def __init__(self, tt_mb=16):
+        self.tt = TranspositionTable(tt_mb)
+        self.history = [[0] * 4096, [0] * 4096]  # [color][from | to << 6]
+        self.killers = [[0, 0] for _ in range(MAX_PLY + 1)]
+        self.nodes = 0
+        self.deadline = 0.0
+
+    def search(self, position, ms=1000, max_depth=MAX_PLY):
+        """
+        Search `position` for about `ms` milliseconds. Returns a dict with
+        move, score (centipawns for the side to move), depth, nodes,
+        nodes_per_sec and pv (principal variation as coordinate moves).
+        """
+        start = time.perf_counter()
+        self.deadline = start + ms / 1000
+        self.nodes = 0
+        self.tt.new_search()
+        self.killers = [[0, 0] for _ in range(MAX_PLY + 1)]
+        for table in self.history:  # keep old history as a hint, but fade it
+            for i in range(4096):
+                table[i] >>= 2
+        moves = position.generate_moves()
+        result = {"move": moves[0] if moves else None, "score": 0, "depth": 0}
+        root_moves = len(position.history)
+        for depth in range(1, max_depth + 1) if moves else ():
+            self._root_best = None
+            try:
+                score = self._negamax(position, depth, -INFINITY, INFINITY, 0)
+            except SearchTimeout:
+                while len(position.history) > root_moves:
+                    position.unmake()
+                if self._root_best is not None:  # best of the moves searched so far
+                    result["move"] = self._root_best
+                break
+            result = {"move": self._root_best, "score": score, "depth": depth}
+            elapsed = time.perf_counter() - start
+            # The next iteration costs several times this one; do not start it late
+            if elapsed > (ms / 1000) / 2 or abs(score) > MATE - MAX_PLY:
+                break
+        elapsed = time.perf_counter() - start
+        result["nodes"] = self.nodes
+        result["nodes_per_sec"] = round(self.nodes / elapsed) if elapsed else self.nodes
+        result["pv"] = [move_name(move) for move in self.principal_variation(position, result["depth"])]
+        return result
+
+    def principal_variation(self, position, depth):
+        """Follow the table's best moves from `position` (legal ones only)."""
+        line = []
+        for _ in range(depth):
+            entry = self.tt.probe(position.hash)
+            if entry is None or entry[4] not in position.generate_moves():
+                break
+            line.append(entry[4])
+            position.make(entry[4])
+        for _ in line:
+            position.unmake()
+        return line
+
+    def _check_time(self):
+        if time.perf_counter() > self.deadline:
+            raise SearchTimeout
+
+    @staticmethod
+    def _is_repetition(position):
+        """Same position, same side to move, since the last capture or pawn move."""
+        history, key = position.history, position.hash
+        stop = max(0, len(history) - position.halfmove)
+        for i in range(len(history) - 2, stop - 1, -2):
+            if history[i][5] == key:
+                return True
+        return False
+
+    def _negamax(self, position, depth, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self._check_time()
+        if ply and (position.halfmove >= 100 or self._is_repetition(position)):
+            return 0
+        if ply >= MAX_PLY:
+            return evaluate(position)
+        in_check = position.in_check()
+        if in_check:
+            depth += 1  # check extension: do not stop the search in the middle of a check
+        if depth <= 0:
+            return self._quiescence(position, alpha, beta, ply)
+
+        key = position.hash
+        entry = self.tt.probe(key)
+        tt_move = 0
+        if entry is not None:
+            tt_move = entry[4]
+            if ply and entry[1] >= depth:
+                score, bound = _score_from_tt(entry[3], ply), entry[2]
+                if (bound == EXACT or (bound == LOWER and score >= beta)
+                        or (bound == UPPER and score <= alpha)):
+                    return score
+
+        moves = position.generate_moves()
+        if not moves:
+            return -MATE + ply if in_check else 0
+        self._order(position, moves, tt_move, ply)
+
+        original_alpha = alpha
+        best_score, best = -INFINITY, 0
+        for move in moves:
+            quiet = position.squares[(move >> 6) & 63] is None and move >> 12 == 0
+            position.make(move)
+            score = -self._negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            position.unmake()
+            if score > best_score:
+                best_score, best = score, move
+                if ply == 0:
+                    self._root_best = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if quiet:
+                            self._record_cutoff(position.side, move, depth, ply)
+                        break
+
+        if best_score >= beta:
+            bound = LOWER
+        elif best_score > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+        self.tt.store(key, depth, bound, _score_to_tt(best_score, ply), best)
+        return best_score
+
+    def _quiescence(self, position, alpha, beta, ply):
+        """Search captures (or all evasions in check) until the position is quiet."""
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self._check_time()
+        in_check = position.in_check()
+        best_score = -INFINITY
+        if not in_check:
+            best_score = evaluate(position)
+            if best_score >= beta or ply >= MAX_PLY:
+                return best_score
+            alpha = max(alpha, best_score)
+        moves = position.generate_moves()
+        if not moves:
+            return -MATE + ply if in_check else 0
+        if not in_check:
+            moves = self._promising_captures(position, moves, best_score, alpha)
+        self._order(position, moves, 0, ply)
+        for move in moves:
+            position.make(move)
+            score = -self._quiescence(position, -beta, -alpha, ply + 1)
+            position.unmake()
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best_score
+
+    @staticmethod
+    def _promising_captures(position, moves, stand_pat, alpha):
+        """
+        Captures and promotions worth a quiescence search. Skipped:
+        - captures that cannot lift the score to alpha even if the piece
+          is won for free (delta pruning, with a 200 centipawn margin)
+        - a more valuable piece taking a defended one (a losing trade)
+        """
+        squares = position.squares
+        them = 1 - position.side
+        occupied = position.occupied
+        result = []
+        for move in moves:
+            to = (move >> 6) & 63
+            if (move >> 12) & 7:
+                result.append(move)
+                continue
+            victim = squares[to]
+            if victim is None and move >> 15 != EN_PASSANT:
+                continue
+            gain = PIECE_VALUES[victim[1] if victim else PAWN]
+            if stand_pat + gain + 200 <= alpha:
+                continue
+            if (PIECE_VALUES[squares[move & 63][1]] > gain
+                    and position._attackers(to, them, occupied)):
+                continue
+            result.append(move)
+        return result
+
+    def _order(self, position, moves, tt_move, ply):
+        """Sort `moves` in place, most promising first."""
+        squares = position.squares
+        first_killer, second_killer = self.killers[min(ply, MAX_PLY)]
+        history = self.history[position.side]
+
+        def priority(move):
+            if move == tt_move:
+                return 1 << 30
+            victim = squares[(move >> 6) & 63]
+            if victim is not None:
+                return (1 << 28) + PIECE_VALUES[victim[1]] * 8 - squares[move & 63][1]
+            if move >> 15 == EN_PASSANT:
+                return (1 << 28) + PIECE_VALUES[PAWN] * 8
+            if (move >> 12) & 7:
+                return (1 << 27) + ((move >> 12) & 7)
+            if move == first_killer:
+                return (1 << 26) + 1
+            if move == second_killer:
+                return 1 << 26
+            return history[move & 4095]
+
+        moves.sort(key=priority, reverse=True)
+
+    def _record_cutoff(self, color, move, depth, ply):
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1], killers[0] = killers[0], move
+        history = self.history[color]
+        history[move & 4095] += depth * depth
+        if history[move & 4095] > 1 << 20:  # keep below the killer priority
+            for i in range(4096):
+                history[i] >>= 1
+
+
+def _score_to_tt(score, ply):
+    """Mate scores are stored relative to the node, not the root."""
+    if score > MATE - MAX_PLY:
+        return score + ply
+    if score < -MATE + MAX_PLY:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score, ply):
+    if score > MATE - MAX_PLY:
+        return score - ply
+    if score < -MATE + MAX_PLY:
+        return score + ply
+    return score
+
+
+_engine = None
+
+
+def best_move(board, ms=1000):
+    """
+    Best move for the side to move, searched for about `ms` milliseconds.
+    `board` is a Position, or a ChessBoard (then White is to move).
+    Returns the move in coordinate notation ("e2e4"), or None if the side
+    to move has no legal move. The transposition table is kept between
+    calls, so analysing consecutive positions of a game gets faster.
+    """
+    global _engine
+    position = board if isinstance(board, Position) else Position.from_board(board)
+    if not position.pieces[WHITE][KING] or not position.pieces[BLACK][KING]:
+        raise ValueError("Both kings must be on the board to search.")
+    if _engine is None:
+        _engine = SearchEngine()
+    move = _engine.search(position, ms)["move"]
+    return move_name(move) if move else None
+
 
 # Example Usage
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chess board")
+    parser.add_argument("--perft", type=int, metavar="DEPTH", help="run the perft benchmark to DEPTH plies")
+    parser.add_argument("--analyse", metavar="FEN", help="search a position given in FEN")
+    parser.add_argument("--ms", type=int, default=2000, help="time budget for --analyse in milliseconds")
+    args = parser.parse_args()
+    if args.perft:
+        for result in run_perft_benchmark(args.perft):
+            print(result)
+        sys.exit(0)
+    if args.analyse:
+        position = Position.from_fen(args.analyse)
+        print(SearchEngine().search(position, args.ms))
+        position.display()
+        sys.exit(0)
+
     board = ChessBoard()
     print("Initial Board:")
     board.display()
@@ -268,3 +1285,10 @@ if __name__ == "__main__":
     print("Trying Invalid Knight Move (7,1) to (5,1):")
     board.move_piece((7, 1), (5, 1))
     board.display()
+
+    print("Same position as bitboards:")
+    bitboard = board.to_bitboard()
+    king_square = next(squares_of(bitboard.pieces[BLACK][KING]))
+    print("Black King in check:", bitboard.is_attacked(king_square, WHITE))
+    print("Squares attacked by White:", bitboard.attacked_squares(WHITE).bit_count())
+    bitboard.display()
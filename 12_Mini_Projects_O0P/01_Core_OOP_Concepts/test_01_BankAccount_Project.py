@@ -0,0 +1,118 @@
+"""
+Tests for 01_BankAccount_Project.py
+
+Run from this folder:
+    python -m pytest -q test_01_BankAccount_Project.py
+"""
+
+import asyncio
+import contextlib
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+bank_project = importlib.import_module("01_BankAccount_Project")
+
+
+class BankAccountTest(unittest.TestCase):
+
+    def test_arithmetic_is_exact_in_cents(self):
+        account = bank_project.BankAccount("A", 0)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            account.deposit(0.1)
+            account.deposit(0.2)
+            self.assertEqual(account.balance, 0.3)
+            account.withdraw(0.3)
+        self.assertEqual(account.balance, 0)
+        self.assertIs(type(account.balance), int)
+
+
+class LedgerBankAccountTest(unittest.TestCase):
+
+    def test_bad_amounts_are_rejected_and_journal_matches_balance(self):
+        account = bank_project.LedgerBankAccount("A", 100)
+        summary = account.post_batch([("deposit", 50), ("deposit", None),
+                                      ("deposit", float("nan")), ("withdraw", "abc")])
+        self.assertEqual((summary["posted"], summary["rejected"]), (1, 3))
+        self.assertEqual(account.balance, 150)
+        self.assertEqual([(kind, str(amount)) for kind, amount in account.history()],
+                         [("opening", "100.00"), ("deposit", "50.00")])
+
+    def test_balance_is_a_plain_number_and_history_adds_up(self):
+        account = bank_project.LedgerBankAccount("A", 100)
+        account.post_batch([("deposit", 0.1), ("withdraw", 30)])
+        self.assertEqual(account.balance, 70.1)
+        self.assertGreater(account.balance, 0)
+        self.assertEqual(account.minor, 7010)
+        total = sum(amount.minor if kind != "withdraw" else -amount.minor
+                    for kind, amount in account.history())
+        self.assertEqual(total, account.minor)
+
+
+@unittest.skipIf(bank_project.np is None, "AccountStore requires NumPy")
+class AccountStoreTest(unittest.TestCase):
+
+    def test_store_with_zero_capacity_grows(self):
+        store = bank_project.AccountStore(capacity=0)
+        store.add_account(7, 20)
+        store.add_accounts([8, 9, 10], [100, 200, 300])
+        self.assertEqual(len(store), 4)
+        self.assertEqual(store[0].balance, 20)
+
+
+class DurableBankStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_open_account_rejects_records_that_cannot_be_stored(self):
+        with bank_project.DurableBankStore(self.tmp.name) as store:
+            self.assertFalse(store.open_account(-5, "Negative"))
+            self.assertFalse(store.open_account(2 ** 64, "Too big"))
+            self.assertFalse(store.open_account(1, "x" * 70000))
+            self.assertTrue(store.open_account(1, "Ok"))
+
+    def test_balances_survive_a_restart_exactly(self):
+        with bank_project.DurableBankStore(self.tmp.name, snapshot_every=50) as store:
+            store.open_account(1, "Whole", balance=67)
+            store.open_account(2, "Cents", balance=0)
+            for _ in range(120):  # crosses two snapshots
+                store.transfer(1, 2, 0.1)
+            self.assertFalse(store.deposit(1, float("nan")))
+        recovered = bank_project.DurableBankStore(self.tmp.name)
+        self.addCleanup(recovered.close)
+        self.assertEqual(recovered.accounts[1].balance, 55)
+        self.assertIs(type(recovered.accounts[1].balance), int)
+        self.assertEqual(recovered.accounts[2].balance, 12)
+        self.assertEqual(recovered.accounts[2].minor, 1200)
+
+
+class AsyncAccountServiceTest(unittest.TestCase):
+
+    def test_cancelled_request_does_not_abort_the_batch(self):
+        async def scenario():
+            accounts = {1: bank_project.BankAccount("A", 100),
+                        2: bank_project.BankAccount("B", 100)}
+            service = bank_project.AsyncAccountService(accounts)
+            first = asyncio.ensure_future(service.submit("DEPOSIT", 1, 10))
+            cancelled = asyncio.ensure_future(service.submit("DEPOSIT", 1, 20))
+            other = asyncio.ensure_future(service.submit("WITHDRAW", 2, 30))
+            await asyncio.sleep(0)  # all three are queued, flush not yet run
+            cancelled.cancel()
+            results = await asyncio.wait_for(
+                asyncio.gather(first, other, return_exceptions=True), timeout=1)
+            return accounts, results, cancelled
+
+        accounts, results, cancelled = asyncio.run(scenario())
+        self.assertEqual(results, [110, 70])
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(accounts[1].balance, 110)  # the cancelled deposit is not applied
+        self.assertEqual(accounts[2].balance, 70)
+
+
+if __name__ == "__main__":
+    unittest.main()
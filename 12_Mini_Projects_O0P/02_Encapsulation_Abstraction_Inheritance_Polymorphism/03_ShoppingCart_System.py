@@ -76,13 +76,19 @@ This is efficient and scalable.
 # ---------- Import ABC for Abstraction ----------
 from abc import ABC, abstractmethod
 
+# ---------- Shared Money type (exact integer cents) ----------
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from Money_Module import Money, MoneyArray
+
 
 # ---------- Abstract Class (Abstraction) ----------
 class Product(ABC):
     def __init__(self, name, price):
         # Encapsulation -> Keeping variables protected
         self._name = name
-        self._price = price
+        self._price = Money.of(price)  # exact cents, converted once at the edge
 
     # Abstract Method -> Forces subclasses to implement
     @abstractmethod
@@ -103,7 +109,7 @@ class DiscountedProduct(Product):
         self._discount = discount
 
     def get_price(self):
-        return self._price - (self._price * self._discount / 100)
+        return self._price.discounted(self._discount)  # rounded once, to the cent
 
 
 # ---------- Shopping Cart (Encapsulation + Polymorphism) ----------
@@ -115,7 +121,7 @@ class ShoppingCart:
         self._items.append(product)
 
     def total(self):
-        return sum(item.get_price() for item in self._items)
+        return MoneyArray(item.get_price() for item in self._items).sum()
 
 
 # ---------- Example Usage ----------
@@ -17,7 +17,13 @@ We will simulate:
 
 
 import datetime   # to track order date/time
+import os
 import random     # to generate unique IDs
+import sys
+
+# Shared Money type: prices and totals are exact integer cents, not floats
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from Money_Module import Money
 
 
 """
@@ -32,7 +38,7 @@ class Product:
     def __init__(self, name: str, price: float, stock: int):
         self.product_id = random.randint(1000, 9999)  # Unique ID
         self.name = name
-        self.price = price
+        self.price = Money.of(price)
         self.stock = stock
 
     def update_stock(self, quantity: int):
@@ -81,7 +87,7 @@ class Order:
         self.order_id = random.randint(100000, 999999)
         self.customer = customer
         self.items = []     # list of tuples (Product, quantity)
-        self.total = 0.0
+        self.total = Money()
         self.date = datetime.datetime.now()
 
     def add_item(self, product: Product, quantity: int):
@@ -94,8 +100,8 @@ class Order:
             print(f"[ERROR] Not enough stock for {product.name}")
 
     def calculate_total(self):
-        """Calculate total cost"""
-        self.total = sum(p.price * q for p, q in self.items)
+        """Calculate total cost (exact: integer cents times integer quantity)"""
+        self.total = Money(sum(p.price.minor * q for p, q in self.items))
 
     def display_order(self):
         """Print order summary"""
@@ -6,9 +6,15 @@ External Library: requests
 API Source: ExchangeRate API (https://api.exchangerate.host)
 """
 
+import os
+import sys
 import requests
 from abc import ABC, abstractmethod
 
+# Shared Money type: amounts are exact integer minor units, floats only at the API edge
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from Money_Module import Money
+
 
 class APIClient(ABC):
     """
@@ -53,7 +59,7 @@ class CurrencyConverter(APIClient):
             params = {
                 "from": self.base_currency,
                 "to": self.target_currency,
-                "amount": amount
+                "amount": float(amount)
             }
             response = requests.get(self.BASE_URL, params=params)
 
@@ -65,15 +71,26 @@ class CurrencyConverter(APIClient):
             print(f" Failed to fetch data: {e}")
             return {}
 
-    def convert(self, amount: float) -> float:
+    def convert(self, amount) -> Money:
         """
         Convert given amount from base currency to target currency.
+        - amount: a number or Money in the base currency
+        - returns Money in the target currency (zero if the API failed)
         """
+        amount = Money.of(amount, self.base_currency)
         data = self.fetch_data(amount)
         if data and "result" in data:
-            return data["result"]
+            return Money.of(data["result"], self.target_currency)
         else:
-            return 0.0
+            return Money(0, self.target_currency)
+
+    def convert_many(self, amounts, rate: float):
+        """
+        Convert many amounts at an already fetched `rate` (one API call for
+        the batch instead of one per amount). Exact, rounded half-up per item.
+        """
+        return [Money.of(a, self.base_currency).convert(rate, self.target_currency)
+                for a in amounts]
 
     def display_conversion(self, amount: float):
         """
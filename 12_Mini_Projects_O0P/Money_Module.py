@@ -0,0 +1,242 @@
+"""
+Shared Money Module
+Category: Utility used by the money-handling mini projects
+
+Problem Statement:
+------------------
+Floats cannot represent most decimal amounts exactly (0.1 + 0.2 != 0.3),
+so totals drift and need rounding fix-ups. This module stores money as an
+integer number of minor units (cents, paisa, ...):
+
+1. Money: one amount, e.g. Money.of("12.34") is stored as 1234 cents.
+   - Exact +, -, multiplication by an integer quantity.
+   - Percentage discounts are rounded once, half-up, to the nearest cent.
+   - Floats / strings are converted only at the edges (of() and __str__).
+2. MoneyArray: many amounts of one currency in a compact array("q"),
+   for batch sums and batch discounts.
+
+Integer arithmetic is exact like Decimal but much faster, and it is what
+the bank, shopping cart, e-commerce and currency converter projects use.
+
+Usage from a mini project folder:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from Money_Module import Money, MoneyArray
+"""
+
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # MoneyArray falls back to pure Python
+    np = None
+
+
+SCALE = 100  # minor units per major unit (2 decimal places)
+
+
+def to_minor(amount):
+    """Convert a number, numeric string or Money to integer minor units."""
+    if isinstance(amount, Money):
+        return amount.minor
+    if isinstance(amount, int):
+        return amount * SCALE
+    if type(amount) is float and -1e9 < amount < 1e9:
+        scaled = amount * SCALE
+        nearest = round(scaled)
+        if abs(scaled - nearest) < 0.49:  # not near a half cent: same result as below
+            return nearest
+    # str(float) gives the shortest repr, so 0.1 becomes exactly "0.1"
+    value = Decimal(str(amount)) * SCALE
+    return int(value.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def from_minor(minor):
+    """Plain number for `minor` units: an int when whole, else a float (e.g. 12.34)."""
+    whole, cents = divmod(minor, SCALE)
+    return whole if not cents else minor / SCALE
+
+
+def percent_of(minor, percent):
+    """`percent`% of `minor` units, rounded half-up (away from zero)."""
+    exact = Fraction(minor) * Fraction(str(percent)) / 100
+    rounded = (abs(exact.numerator) * 2 + exact.denominator) // (2 * exact.denominator)
+    return rounded if exact >= 0 else -rounded
+
+
+class Money:
+    """An exact amount of money stored as integer minor units."""
+
+    __slots__ = ("minor", "currency")
+
+    def __init__(self, minor=0, currency="USD"):
+        self.minor = int(minor)
+        self.currency = currency
+
+    @classmethod
+    def of(cls, amount, currency="USD"):
+        """Build Money from major units, e.g. Money.of(12.5) -> 12.50."""
+        return cls(to_minor(amount), currency)
+
+    def _check(self, other):
+        if not isinstance(other, Money):
+            return NotImplemented
+        if other.currency != self.currency:
+            raise ValueError(f"Currency mismatch: {self.currency} vs {other.currency}")
+        return other.minor
+
+    def __add__(self, other):
+        if isinstance(other, int) and other == 0:  # lets sum() start from 0
+            return self
+        minor = self._check(other)
+        if minor is NotImplemented:
+            return NotImplemented
+        return Money(self.minor + minor, self.currency)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        minor = self._check(other)
+        if minor is NotImplemented:
+            return NotImplemented
+        return Money(self.minor - minor, self.currency)
+
+    def __neg__(self):
+        return Money(-self.minor, self.currency)
+
+    def __mul__(self, quantity):
+        """Multiply by an integer quantity (exact)."""
+        if not isinstance(quantity, int):
+            return NotImplemented
+        return Money(self.minor * quantity, self.currency)
+
+    __rmul__ = __mul__
+
+    def percent(self, percent):
+        """`percent`% of this amount, rounded half-up to a minor unit."""
+        return Money(percent_of(self.minor, percent), self.currency)
+
+    def discounted(self, percent):
+        """This amount after a `percent`% discount."""
+        return self - self.percent(percent)
+
+    def convert(self, rate, currency):
+        """Convert at an exchange `rate` (major per major) into `currency`."""
+        return Money(percent_of(self.minor, Fraction(str(rate)) * 100), currency)
+
+    def to_decimal(self):
+        return Decimal(self.minor) / SCALE
+
+    def __float__(self):
+        return self.minor / SCALE
+
+    def __eq__(self, other):
+        if isinstance(other, Money):
+            return self.minor == other.minor and self.currency == other.currency
+        return NotImplemented
+
+    def __lt__(self, other):
+        minor = self._check(other)
+        return NotImplemented if minor is NotImplemented else self.minor < minor
+
+    def __le__(self, other):
+        minor = self._check(other)
+        return NotImplemented if minor is NotImplemented else self.minor <= minor
+
+    def __gt__(self, other):
+        minor = self._check(other)
+        return NotImplemented if minor is NotImplemented else self.minor > minor
+
+    def __ge__(self, other):
+        minor = self._check(other)
+        return NotImplemented if minor is NotImplemented else self.minor >= minor
+
+    def __bool__(self):
+        return self.minor != 0
+
+    def __hash__(self):
+        return hash((self.minor, self.currency))
+
+    def __format__(self, spec):
+        return format(self.to_decimal(), spec or ".2f")
+
+    def __str__(self):
+        return f"{self.to_decimal():.2f}"
+
+    def __repr__(self):
+        return f"Money('{self}', '{self.currency}')"
+
+
+class MoneyArray:
+    """
+    Many amounts of one currency stored as a compact array of int64 cents.
+
+    - sum() is an exact integer sum.
+    - discounted() applies per-item percentage discounts in one batch
+      (vectorized with NumPy when it is installed).
+    """
+
+    def __init__(self, amounts=(), currency="USD"):
+        self.currency = currency
+        self._minor = array("q")
+        self.extend(amounts)
+
+    @classmethod
+    def from_minor(cls, minor_units, currency="USD"):
+        """Build directly from integer minor units (no conversion)."""
+        result = cls(currency=currency)
+        result._minor.extend(minor_units)
+        return result
+
+    def append(self, amount):
+        self._minor.append(to_minor(amount))
+
+    def extend(self, amounts):
+        self._minor.extend(to_minor(a) for a in amounts)
+
+    def sum(self):
+        """Exact total as Money."""
+        return Money(sum(self._minor), self.currency)
+
+    def discounted(self, percents):
+        """
+        New MoneyArray after applying percents[i]% off item i.
+        Whole-number percents take the integer fast path; others are
+        rounded exactly with percent_of(). Both round half-up, away from zero.
+        """
+        if len(percents) != len(self._minor):
+            raise ValueError("Need exactly one discount per amount.")
+        if all(isinstance(p, int) for p in percents):
+            if np is not None:
+                minor = np.frombuffer(self._minor, dtype=np.int64)
+                scaled = minor * np.asarray(percents, dtype=np.int64)
+                off = np.sign(scaled) * ((np.abs(scaled) + 50) // 100)
+                return MoneyArray.from_minor((minor - off).tolist(), self.currency)
+            return MoneyArray.from_minor(
+                (m - ((abs(m * p) + 50) // 100 if m * p >= 0 else -((abs(m * p) + 50) // 100))
+                 for m, p in zip(self._minor, percents)),
+                self.currency)
+        return MoneyArray.from_minor(
+            (m - percent_of(m, p) for m, p in zip(self._minor, percents)),
+            self.currency)
+
+    def __getitem__(self, index):
+        return Money(self._minor[index], self.currency)
+
+    def __len__(self):
+        return len(self._minor)
+
+    def __iter__(self):
+        currency = self.currency
+        return (Money(m, currency) for m in self._minor)
+
+
+# ------------------ Example Usage ------------------ #
+if __name__ == "__main__":
+    print(0.1 + 0.2, "vs", Money.of(0.1) + Money.of(0.2))       # 0.30000000000000004 vs 0.30
+    price = Money.of("19.99")
+    print(f"3 x {price} = {price * 3}, 15% off = {price.discounted(15)}")
+    prices = MoneyArray([1200, 200, 50])
+    print("Cart total:", prices.sum(), "| after discounts:", prices.discounted([0, 20, 10]).sum())
+    print("100 USD in PKR:", Money.of(100).convert(278.35, "PKR"))